@@ -1,7 +1,3 @@
-import sys
-sys.path.insert(0,"src")
-sys.path.insert(0,"../src")
-
 from option_strategy_sim import (
     calculate_price_probability,
     black_scholes,
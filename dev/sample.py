@@ -1,9 +1,3 @@
-import sys
-sys.path.insert(0,"./src")
-sys.path.insert(0,"../src")
-print(sys.path)
-print(type(sys.path))
-
 from option_strategy_sim import (
     OptionStrategy, 
     calculate_price_probability,
@@ -1,7 +1,4 @@
 
-import sys
-sys.path.insert(0,"src")
-sys.path.insert(0,"../src")
 from option_strategy_sim import OptionStrategy
 from tabulate import tabulate
 
@@ -1,26 +1,43 @@
 from .core import OptionStrategy
-from .plot import plot_strategy
 from .greeks import (
-    black_scholes, 
-    black_scholes_vega, 
-    calculate_price_probability, 
-    expected_move, 
-    black_scholes_vega, 
+    black_scholes,
+    black_scholes_vec,
+    black_scholes_vega,
+    calculate_price_probability,
+    calculate_price_probability_vec,
+    expected_move,
     implied_volatility_newton_raphson,
+    implied_volatility_newton_raphson_vec,
     black_scholes_gamma,
+    clear_greeks_cache,
+    precompile_kernels,
     Greeks)
+from .utils import calculate_ema
 
 VERSION: float = 0.1
 
 __all__ = [
     'OptionStrategy',
-    'plot_strategy'
-    'Greeks'
-    'black_scholes', 
-    'calculate_ema', 
+    'plot_strategy',
+    'Greeks',
+    'black_scholes',
+    'black_scholes_vec',
+    'calculate_ema',
     'calculate_price_probability',
+    'calculate_price_probability_vec',
     'expected_move',
     'black_scholes_vega',
     'black_scholes_gamma',
     'implied_volatility_newton_raphson',
+    'implied_volatility_newton_raphson_vec',
+    'clear_greeks_cache',
+    'precompile_kernels',
 ]
+
+
+def __getattr__(name: str):
+    # plot_strategy brings in matplotlib, import it on first access only
+    if name == 'plot_strategy':
+        from .plot import plot_strategy
+        return plot_strategy
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
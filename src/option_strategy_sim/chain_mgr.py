@@ -1,10 +1,14 @@
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import pandas as pd
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, PrivateAttr, field_validator
 from datetime import date
 from typing import Optional
 
+from .utils import njit, HAS_NUMBA
+
 """
 There are 3 classes here:
 
@@ -18,6 +22,8 @@ There are 3 classes here:
             Filters out uninteresting option chains based on open interest, delta, and underlying price.
         get_symbol_chain(underlying_symbol)
             Returns OptionChainsSym object for given symbol
+        batch_evaluate(symbols, strategy_fn, n_jobs=1)
+            Returns {symbol: strategy_fn(OptionChainsSym)}, optionally spread over worker processes
         
 2) OptionChainsSym
     Holds the option chains for a given underlying symbol
@@ -101,7 +107,75 @@ def get_first_value(df: pd.DataFrame, column_name: str):
     Returns:
         The first value in the specified column.
     """
-    return df[column_name].iloc[0]
+    # positional scalar read, no Series built for the column or the row
+    return df.iat[0, df.columns.get_loc(column_name)]
+
+
+# direction codes for the closest value kernel
+_DIRECTIONS = {"absolute": 0, "less_than": 1, "greater_than": 2}
+
+
+@njit(cache=True)
+def _closest_idx(values, target, direction):
+    """First position of the value closest to target, -1 if none qualifies"""
+    # no fastmath here, nan values must compare false and be skipped
+    best = -1
+    best_diff = np.inf
+    for i in range(values.shape[0]):
+        v = values[i]
+        if direction == 1 and v > target:
+            continue
+        if direction == 2 and v < target:
+            continue
+        d = abs(v - target)
+        if d < best_diff:
+            best_diff = d
+            best = i
+    return best
+
+
+def closest_index(values: np.ndarray, target_value: float, direction: str = "absolute") -> int | None:
+    """
+    Finds the position of the value closest to a target value.
+
+    Args:
+        values (np.ndarray): The values to search.
+        target_value (float): The target value to find the closest match to.
+        direction (str): Specifies the direction for finding the closest value.
+            Options: 'absolute', 'less_than', 'greater_than'.  Defaults to 'absolute'.
+
+    Returns:
+        int | None: Position of the first closest value, None if no value qualifies.
+
+    Raises:
+        ValueError: If the `direction` argument is not one of the valid options.
+    """
+    if direction not in _DIRECTIONS:
+        raise ValueError(
+            "Invalid direction. Must be 'absolute', 'less_than', or 'greater_than'."
+        )
+    if HAS_NUMBA:
+        # one compiled pass, no temporaries
+        closest_idx = _closest_idx(values, float(target_value), _DIRECTIONS[direction])
+        return None if closest_idx < 0 else int(closest_idx)
+    if direction == "absolute":
+        # Calculate absolute difference from the target value
+        difference = np.abs(values - target_value)
+    elif direction == "less_than":
+        # Only values less than or equal to the target value are candidates
+        difference = np.where(values <= target_value, target_value - values, np.inf)
+    elif direction == "greater_than":
+        # Only values greater than or equal to the target value are candidates
+        difference = np.where(values >= target_value, values - target_value, np.inf)
+    # missing values are never the closest
+    difference[np.isnan(difference)] = np.inf
+    if len(difference) == 0:
+        return None
+    # a linear scan rather than a sort
+    closest_idx = int(difference.argmin())
+    if difference[closest_idx] == np.inf:
+        return None
+    return closest_idx
 
 
 def filter_by_closest_value(
@@ -132,36 +206,15 @@ def filter_by_closest_value(
     if df.empty:
         return pd.DataFrame()
 
-    if direction == "absolute":
-        # Calculate absolute difference from the target value
-        difference = (df[column_name] - target_value).abs()
-    elif direction == "less_than":
-        # Filter values less than or equal to the target value
-        filtered_df = df.loc[df[column_name] <= target_value]
-        if filtered_df.empty:
-            return pd.DataFrame()
-        # Calculate absolute difference from the target value
-        difference = (target_value - filtered_df[column_name]).abs()
-        df = filtered_df  # Update df to the filtered DataFrame
-    elif direction == "greater_than":
-        # Filter values greater than or equal to the target value
-        filtered_df = df.loc[df[column_name] >= target_value]
-        if filtered_df.empty:
-            return pd.DataFrame()
-        # Calculate absolute difference from the target value
-        difference = (filtered_df[column_name] - target_value).abs()
-        df = filtered_df  # Update df to the filtered DataFrame
-    else:
-        raise ValueError(
-            "Invalid direction. Must be 'absolute', 'less_than', or 'greater_than'."
-        )
-
-    # Get the closest value based on the calculated differences
-    closest_value = df[column_name].iloc[difference.argsort()].iloc[0]
+    values = df[column_name].to_numpy(dtype=float)
+    closest_idx = closest_index(values, target_value, direction)
+    if closest_idx is None:
+        return pd.DataFrame()
+    closest_value = values[closest_idx]
     if exact and closest_value != target_value:
         return pd.DataFrame()
     # Return a DataFrame containing rows that match the closest value
-    return df[df[column_name] == closest_value].copy()
+    return df.loc[values == closest_value]
 
 
 def filter_by_value(df: pd.DataFrame, column_name: str, value=None):
@@ -177,7 +230,7 @@ def filter_by_value(df: pd.DataFrame, column_name: str, value=None):
     Returns:
         pd.DataFrame: A filtered DataFrame where the specified column equals the given value.
                       Returns an empty DataFrame if no matches are found.
-                      Returns a copy of the original DataFrame if value is None.
+                      Returns the original DataFrame if value is None.
 
     Raises:
         TypeError: If the input is not a pandas DataFrame.
@@ -188,9 +241,9 @@ def filter_by_value(df: pd.DataFrame, column_name: str, value=None):
         return pd.DataFrame({})
     # If value is None, return the original DataFrame
     if value is None:
-        return df.copy()
-    # Filter the DataFrame and return a copy
-    return df.loc[df[column_name] == value].copy()
+        return df
+    # Filter the DataFrame, callers assign() rather than mutate the result
+    return df.loc[df[column_name].to_numpy() == value]
 
 
 def filter_option_chains(
@@ -218,20 +271,20 @@ def filter_option_chains(
     Returns:
         pd.DataFrame: A filtered DataFrame with the specified criteria applied.
     """
-    filtered_df = chains.copy()
+    # equality filters combine into one mask, the frame is indexed once
+    mask = np.ones(len(chains), dtype=bool)
     if symbol is not None:
-        filtered_df = filter_by_value(
-            filtered_df, "underlying_symbol", value=symbol
-        )
+        # compare as a series, a categorical symbol column compares codes
+        mask &= (chains["underlying_symbol"] == symbol).to_numpy()
     if expiration_date is not None:
-        filtered_df = filter_by_value(
-            filtered_df, "expiration_date", value=expiration_date
-        )
+        mask &= chains["expiration_date"].to_numpy() == expiration_date
     if option_type is not None:
-        filtered_df = filter_by_value(filtered_df, "option_type", value=option_type)
+        mask &= chains["option_type"].to_numpy() == option_type
+    filtered_df = chains if mask.all() else chains.loc[mask]
+    # closest value filters depend on the rows left
     if strike_price is not None:
         filtered_df = filter_by_closest_value(
-            filtered_df, "strike_price", value=strike_price, exact=exact
+            filtered_df, "strike_price", strike_price, exact=exact
         )
     if days_to_expiration is not None:
         filtered_df = filter_by_closest_value(
@@ -254,8 +307,16 @@ def get_chains_from_csv(csv_file_path, prune_spx: bool = True) -> pd.DataFrame:
         pd.DataFrame: A DataFrame containing the option chain data.
     """
     chains = pd.read_csv(csv_file_path)
-    # prune extra header insertions
-    chains = chains.loc[chains["underlying_symbol"] != "underlying_symbol"].copy()
+    # prune extra header insertions, most files have none so skip the copy
+    is_header = chains["underlying_symbol"].to_numpy() == "underlying_symbol"
+    if is_header.any():
+        chains = chains.loc[~is_header]
+        # the header rows left number columns as strings
+        for column in chains.columns:
+            try:
+                chains[column] = pd.to_numeric(chains[column])
+            except (ValueError, TypeError):
+                pass
     return chains
 
 
@@ -278,9 +339,7 @@ def prepare_chains(chains: pd.DataFrame, prune_spx: bool = True) -> pd.DataFrame
         # remove SPX options... just keep SPXW in there to prune dupes
         # remove SQQQ1 options.... keep the SQQQ
         # remove UVXY2 options keep the SQQQ
-        chains = chains[~chains.symbol.str.startswith("SPX ")].copy()
-        chains = chains[~chains.symbol.str.startswith("SQQQ1 ")].copy()
-        chains = chains[~chains.symbol.str.startswith("UVXY2 ")].copy()
+        chains = chains[~chains.symbol.str.startswith(("SPX ", "SQQQ1 ", "UVXY2 "))].copy()
 
     # Define column data types
     float_fields = [
@@ -307,25 +366,29 @@ def prepare_chains(chains: pd.DataFrame, prune_spx: bool = True) -> pd.DataFrame
     str_fields = ["underlying_symbol", "option_type"]
     date_fields = ["quote_date", "expiration_date"]
 
+    # some brokers have no prev_day_volume, alias it so the volume ratio has one column to use
+    if "prev_day_volume" not in chains.columns:
+        for alias in ("volume", "open_interest"):
+            if alias in chains.columns:
+                chains["prev_day_volume"] = chains[alias]
+                break
+
     # Calculate strike percent as distance from strike to current price
-    chains.loc[:, "strike_percent"] = (
-        chains["strike_price"] - chains["underlying_price"]
-    ) / chains["underlying_price"]
+    strike = chains["strike_price"].to_numpy(dtype=float)
+    underlying = chains["underlying_price"].to_numpy(dtype=float)
+    chains["strike_percent"] = (strike - underlying) / underlying
     # Switch time from ms to sec
-    chains["time"] = (chains["time"].copy() / 1000).astype(np.int64)
+    chains["time"] = chains["time"].to_numpy(dtype=np.int64) // 1000
     # Add quote_day field
-    chains["quote_date"] = pd.to_datetime(chains["time"], unit="s").dt.date
-
-    # Set datatypes ( .. or we could use a pydantic model ? )
-    for field in float_fields:
-        chains[field] = chains[field].astype(float)
-    for field in int_fields:
-        chains[field] = chains[field].astype(int)
-    for field in str_fields:
-        chains[field] = chains[field].astype(str)
-    for field in date_fields:
-        chains[field] = chains[field].astype(str)
-    return chains
+    chains["quote_date"] = pd.to_datetime(chains["time"], unit="s").dt.strftime("%Y-%m-%d")
+
+    # Set datatypes in one pass ( .. or we could use a pydantic model ? )
+    dtypes = (
+        {field: float for field in float_fields}
+        | {field: int for field in int_fields}
+        | {field: str for field in str_fields + date_fields}
+    )
+    return chains.astype(dtypes)
 
 
 class OptionChainsSymDTE(BaseModel, arbitrary_types_allowed=True):
@@ -335,14 +398,40 @@ class OptionChainsSymDTE(BaseModel, arbitrary_types_allowed=True):
     calls: pd.DataFrame = None
     puts: pd.DataFrame = None
 
-    legs: pd.DataFrame = pd.DataFrame()
+    # contract legs, concatenated when read through legs
+    _legs: list = PrivateAttr(default_factory=list)
+
+    # numpy columns of calls / puts / chain, by (option_type, column)
+    _columns: dict = PrivateAttr(default_factory=dict)
+    # contract rows found by _contract, by lookup arguments
+    _contracts: dict = PrivateAttr(default_factory=dict)
+
+    # per chain scalars, read once rather than through pandas on every call
+    _underlying_price: float = PrivateAttr(default=None)
+    _underlying_symbol: str = PrivateAttr(default=None)
+    _dte: int = PrivateAttr(default=None)
+    _vol_key: str = PrivateAttr(default=None)
+    _has_volatility: bool = PrivateAttr(default=False)
 
     def model_post_init(self, context):
         """
         Post-initialization to filter calls and puts from the chain.
         """
-        self.puts = filter_option_chains(self.chain, option_type="P")
-        self.calls = filter_option_chains(self.chain, option_type="C")
+        # one pass over option_type splits the chain, rather than a filtered copy per type
+        is_call = self.chain["option_type"].to_numpy() == "C"
+        self.calls = self.chain.loc[is_call]
+        self.puts = self.chain.loc[~is_call]
+
+        columns = self.chain.columns
+        if len(self.chain) > 0:
+            self._underlying_price = float(self.chain["underlying_price"].iat[0])
+            self._underlying_symbol = str(self.chain["underlying_symbol"].iat[0])
+            self._dte = int(self.chain["days_to_expiration"].iat[0])
+        for key in ('prev_day_volume', 'volume', 'open_interest'):
+            if key in columns:
+                self._vol_key = key
+                break
+        self._has_volatility = 'volatility' in columns
         return super().model_post_init(context)
 
     def repr(self):
@@ -358,7 +447,7 @@ class OptionChainsSymDTE(BaseModel, arbitrary_types_allowed=True):
         Returns:
             float: The underlying price.
         """
-        return get_first_value(self.chain, "underlying_price")
+        return self._underlying_price
 
     def underlying_symbol(self) -> str:
         """
@@ -367,7 +456,7 @@ class OptionChainsSymDTE(BaseModel, arbitrary_types_allowed=True):
         Returns:
             str: The underlying symbol.
         """
-        return get_first_value(self.chain, "underlying_symbol")
+        return self._underlying_symbol
 
     def days_to_expiration(self) -> int:
         """
@@ -376,7 +465,7 @@ class OptionChainsSymDTE(BaseModel, arbitrary_types_allowed=True):
         Returns:
             int: The days to expiration.
         """
-        return get_first_value(self.chain, "days_to_expiration")
+        return self._dte
 
     def strikes(self) -> list[ str ]:
         """
@@ -397,15 +486,16 @@ class OptionChainsSymDTE(BaseModel, arbitrary_types_allowed=True):
         Raises:
             ValueError: If 'volatility' is not found in the option chain fields.
         """
-        if 'volatility' not in self.calls:
+        if not self._has_volatility:
             raise ValueError ("volatility not found in option chain fields")
             # TODO , compute iv from bid/ask ?
         # average volatility for strikes within 12% of underlying
-        df = self.chain[abs(self.chain['strike_percent']) < 0.12]
-        # return df[['volatility']].sum()/len(df)
-        if len(df) == 0:
+        near = np.abs(self._column_values(None, 'strike_percent')) < 0.12
+        vols = self._column_values(None, 'volatility')[near]
+        if vols.size == 0:
             return 0
-        return float(df['volatility'].sum()/len(df))
+        # nansum, missing vols count as zero like the pandas sum did
+        return float(np.nansum(vols)/vols.size)
     
     def calc_volume_ratio(self) -> float:
         """
@@ -413,13 +503,7 @@ class OptionChainsSymDTE(BaseModel, arbitrary_types_allowed=True):
         returns -1 ... 1 where 0 is equal volume b/n puts and calls
         A negative number is put skewed , a positive number is call skewed
         """
-        key: str = None
-        if 'prev_day_volume' in self.calls:
-            key = 'prev_day_volume'
-        elif 'volume' in self.calls:
-            key = 'volume'
-        elif 'open_interest' in self.calls:
-            key = 'open_interest'
+        key: str = self._vol_key
         if key is None:
             return 1 
         tput = self.puts[key].sum()
@@ -439,12 +523,15 @@ class OptionChainsSymDTE(BaseModel, arbitrary_types_allowed=True):
 
         """
 
-        p = self.puts[self.puts['delta'] > -0.4].loc[self.puts['delta'] < -0.1]
-        c = self.calls[self.calls['delta'] < 0.4].loc[self.calls['delta'] > 0.1].copy()
-        if len(p) == 0 or len(c) == 0:
+        pdelta = self._column_values('P', 'delta')
+        cdelta = self._column_values('C', 'delta')
+        pvol = self._column_values('P', 'volatility')[(pdelta > -0.4) & (pdelta < -0.1)]
+        cvol = self._column_values('C', 'volatility')[(cdelta < 0.4) & (cdelta > 0.1)]
+        if pvol.size == 0 or cvol.size == 0:
             return 0
-        pv = p['volatility'].sum()/len(p)
-        cv = c['volatility'].sum()/len(c)
+        # nansum, missing vols count as zero like the pandas sum did, as in calc_iv
+        pv = np.nansum(pvol)/pvol.size
+        cv = np.nansum(cvol)/cvol.size
         if pv < cv:
             return float(1 - pv/cv)
         else:
@@ -464,23 +551,48 @@ class OptionChainsSymDTE(BaseModel, arbitrary_types_allowed=True):
         # TODO match on less than / greater than ?
         if option_type is None and symbol is None:
             raise ValueError("option_type or symbol required")
+        # strategies ask for the same contracts over and over, the chain does not change
+        lookup = (option_type, symbol, key, val, direction)
+        if lookup in self._contracts:
+            return self._contracts[lookup]
         if symbol is not None: # there can be only one
-            ctct: pd.DataFrame = filter_by_value(self.chain,'symbol', value=symbol)
+            match = np.flatnonzero(self._column_values(None, 'symbol') == symbol)
+            ctct = None if match.size == 0 else self.chain.iloc[[match[0]]]
         else:
             df = self.calls if option_type == 'C' else self.puts
-            ctct: pd.DataFrame = filter_by_closest_value(df, key, val, direction=direction) #iloc[0]
-        return None if ctct.empty else ctct.head(1)
+            # the first closest row, as filter_by_closest_value(...).head(1) would give
+            pos = closest_index(self._column_values(option_type, key), val, direction=direction)
+            ctct = None if pos is None else df.iloc[[pos]]
+        self._contracts[lookup] = ctct
+        return ctct
+
+    def _column_values(self, option_type: str, key: str) -> np.ndarray:
+        """Numpy array of a calls, puts or whole chain (option_type None) column, converted once per chain"""
+        if (option_type, key) not in self._columns:
+            df = self.chain if option_type is None else self.calls if option_type == 'C' else self.puts
+            values = df[key].to_numpy()
+            if values.dtype.kind in 'iuf':
+                # numbers as float for the closest value search
+                values = values.astype(float, copy=False)
+            self._columns[(option_type, key)] = values
+        return self._columns[(option_type, key)]
+
+    @property
+    def legs(self) -> pd.DataFrame:
+        """All contract legs as one dataframe"""
+        if len(self._legs) == 0:
+            return pd.DataFrame()
+        return pd.concat(self._legs, axis=0, ignore_index=True)
 
     def clear_legs(self) -> None:
-        # concat DF contract legs to strategy
-        self.legs = pd.DataFrame()
+        # drop contract legs from strategy
+        self._legs = []
 
     def join_legs(self, *legs, clear: bool = False) -> pd.DataFrame:
-        # concat DF contract legs to strategy
+        # add DF contract legs to strategy, one concat on read
         if clear:
             self.clear_legs()
-        if len(legs) > 0:
-            self.legs = pd.concat([self.legs,*legs], axis=0, ignore_index=True)
+        self._legs.extend(legs)
         return self.legs
     
     def delta(self, option_type: str, delta: float) -> float:
@@ -516,7 +628,7 @@ class OptionChainsSymDTE(BaseModel, arbitrary_types_allowed=True):
             c = self._contract(option_type=option_type, key='delta', val=delta)
         else:
             raise ValueError("contract needs delta or symbol")
-        c['quantity'] = quantity
+        c = c.assign(quantity=quantity)
         return self.join_legs(c, clear=clear)
     
     def iron_condor(
@@ -558,12 +670,12 @@ class OptionChainsSymDTE(BaseModel, arbitrary_types_allowed=True):
         if otm_c is None or otm_p is None:
             return None
         
-        if atm_c.iloc[0]['strike_price'] == otm_c.iloc[0]['strike_price']:
+        if get_first_value(atm_c, 'strike_price') == get_first_value(otm_c, 'strike_price'):
             # these matched, go out one strike
             otm_c = self._step_out_contract(otm_c)
             if otm_c is None:
                 return None
-        if atm_p.iloc[0]['strike_price'] == otm_p.iloc[0]['strike_price']:
+        if get_first_value(atm_p, 'strike_price') == get_first_value(otm_p, 'strike_price'):
             # these matched, go out one strike
             otm_p = self._step_out_contract(otm_p)
             if otm_p is None:
@@ -571,11 +683,9 @@ class OptionChainsSymDTE(BaseModel, arbitrary_types_allowed=True):
 
 
 
-        atm_c['quantity'] = quantity
-        atm_p['quantity'] = quantity
-        otm_c['quantity'] = -quantity
-        otm_p['quantity'] = -quantity
-        return self.join_legs(otm_c, atm_c, atm_p, otm_p, clear=clear)
+        legs = self._quantity_legs(
+            [otm_c, atm_c, atm_p, otm_p], [-quantity, quantity, quantity, -quantity])
+        return self.join_legs(legs, clear=clear)
 
     def straddle(
             self,
@@ -591,9 +701,7 @@ class OptionChainsSymDTE(BaseModel, arbitrary_types_allowed=True):
         else:
             c = self._contract(option_type='C', key ='strike', val=strike)
             p = self._contract(option_type='P', key='strike', val=strike)
-        c['quantity'] = quantity
-        p['quantity'] = quantity
-        return self.join_legs(c, p, clear=clear)
+        return self.join_legs(self._quantity_legs([c, p], [quantity, quantity]), clear=clear)
 
     def strangle(
             self,
@@ -609,9 +717,7 @@ class OptionChainsSymDTE(BaseModel, arbitrary_types_allowed=True):
         else:
             c = self._contract(option_type='C', key ='delta', val=delta)
             p = self._contract(option_type='P', key='delta', val=-delta)
-        c['quantity'] = quantity
-        p['quantity'] = quantity
-        return self.join_legs(c, p, clear=clear)
+        return self.join_legs(self._quantity_legs([c, p], [quantity, quantity]), clear=clear)
     
     def spread(
             self,
@@ -647,32 +753,41 @@ class OptionChainsSymDTE(BaseModel, arbitrary_types_allowed=True):
         if ct_b is None:
             return None
 
-        if ct_b.iloc[0]['strike_price'] == ct_a.iloc[0]['strike_price']:
+        if get_first_value(ct_b, 'strike_price') == get_first_value(ct_a, 'strike_price'):
             # these matched, go out one strike
             ct_b = self._step_out_contract(ct_b)
             if ct_b is None:
                 return None
 
-        ct_a['quantity'] = quantity 
-        ct_b['quantity'] = -quantity
-        return self.join_legs(ct_a, ct_b, clear=clear)
+        return self.join_legs(self._quantity_legs([ct_a, ct_b], [quantity, -quantity]), clear=clear)
+
 
+    def _quantity_legs(self, legs: list, quantities: list) -> pd.DataFrame:
+        # the contract rows as one frame, quantity set with one column write
+        return pd.concat(legs, axis=0, ignore_index=True).assign(quantity=quantities)
 
     def _step_out_contract(self,ct):
-        # get next contract further OTM
-        target_strike = ct.iloc[0]['strike_price']
-        option_type = ct.iloc[0]['option_type']
+        # get next contract further OTM, the neighbouring listed strike
+        strike = get_first_value(ct, 'strike_price')
+        option_type = get_first_value(ct, 'option_type')
+        strikes = self._strikes(option_type)
         if option_type == 'P':
-            direction = 'less_than'
-            target_strike =  target_strike - 0.05
+            i = np.searchsorted(strikes, strike, side='left') - 1
         else:
-            direction = 'greater_than'
-            target_strike =  target_strike + 0.05
+            i = np.searchsorted(strikes, strike, side='right')
+        if i < 0 or i >= len(strikes):
+            return None
         return self._contract(
             option_type=option_type, 
             key='strike_price', 
-            val=target_strike, 
-            direction=direction)
+            val=float(strikes[i]))
+
+    def _strikes(self, option_type: str) -> np.ndarray:
+        """Sorted unique strikes of the calls or puts"""
+        if (option_type, 'strikes') not in self._columns:
+            strikes = self._column_values(option_type, 'strike_price')
+            self._columns[(option_type, 'strikes')] = np.unique(strikes[~np.isnan(strikes)])
+        return self._columns[(option_type, 'strikes')]
 
 
 class OptionChainsSym(BaseModel, arbitrary_types_allowed=True):
@@ -680,11 +795,20 @@ class OptionChainsSym(BaseModel, arbitrary_types_allowed=True):
     # internal \/
     expiration_dates: dict = {}
 
-    def __post_init__(self):
+    # chain rows grouped once per days to expiration / expiration date
+    _by_dte: dict = PrivateAttr(default_factory=dict)
+    _by_expdate: dict = PrivateAttr(default_factory=dict)
+    _dtes: np.ndarray = PrivateAttr(default=None)
+
+    def model_post_init(self, context):
         """
-        Post-initialization method.
+        Post-initialization to group the chains by expiration.
         """
-        pass
+        # sort=False keeps the chain order, so ties go to the first dte seen as before
+        self._by_dte = dict(iter(self.chains.groupby("days_to_expiration", sort=False)))
+        self._by_expdate = dict(iter(self.chains.groupby("expiration_date", sort=False)))
+        self._dtes = np.fromiter(self._by_dte, dtype=float, count=len(self._by_dte))
+        return super().model_post_init(context)
 
     def get_dte_chain(self, days_to_expiration: int, exact: bool = False) -> OptionChainsSymDTE:
         """
@@ -698,12 +822,15 @@ class OptionChainsSym(BaseModel, arbitrary_types_allowed=True):
         Returns:
             OptionChainsSymDTE: An OptionChainsSymDTE object for the expiration date.
         """
-        key = str(days_to_expiration) + "E" if exact else "~"
+        key = str(days_to_expiration) + ("E" if exact else "~")
         if key not in self.expiration_dates:
-            expiration_date_chain: pd.DataFrame = filter_option_chains(
-                self.chains, days_to_expiration=days_to_expiration, exact=exact
-            )
-            if expiration_date_chain.empty:
+            if exact:
+                expiration_date_chain = self._by_dte.get(days_to_expiration)
+            else:
+                # nearest of the few expirations, rather than a scan of every row
+                pos = closest_index(self._dtes, days_to_expiration)
+                expiration_date_chain = None if pos is None else self._by_dte[self._dtes[pos]]
+            if expiration_date_chain is None or expiration_date_chain.empty:
                 self.expiration_dates[key] = None
             else:
                 self.expiration_dates[key] = OptionChainsSymDTE(
@@ -725,10 +852,8 @@ class OptionChainsSym(BaseModel, arbitrary_types_allowed=True):
         """
         key = str(expiration_date) 
         if key not in self.expiration_dates:
-            expiration_date_chain: pd.DataFrame = filter_by_value(
-                self.chains, 'expiration_date', expiration_date 
-            )
-            if expiration_date_chain.empty:
+            expiration_date_chain = self._by_expdate.get(expiration_date)
+            if expiration_date_chain is None:
                 self.expiration_dates[key] = None
             else:
                 self.expiration_dates[key] = OptionChainsSymDTE(
@@ -770,6 +895,8 @@ class OptionChains(BaseModel, arbitrary_types_allowed=True):
 
     # internal \/
     symbol_chains: dict = {}
+    # row positions of each underlying symbol, built on first lookup
+    _symbol_rows: dict = PrivateAttr(default=None)
 
     def model_post_init(self, context):
         """
@@ -781,6 +908,9 @@ class OptionChains(BaseModel, arbitrary_types_allowed=True):
         elif not isinstance(self.chains, pd.DataFrame):
             raise ValueError("Unimplemented chain source")
         self.chains = prepare_chains(chains=self.chains, prune_spx=True)
+        # few symbols over many rows, keep them as categories in order of appearance
+        symbols = self.chains["underlying_symbol"]
+        self.chains["underlying_symbol"] = pd.Categorical(symbols, categories=symbols.unique())
         return super().model_post_init(context)
 
     def purge(self, open_interest_threshold=10, delta_min=0.03, delta_max=0.97, price_min=10) -> None:
@@ -793,12 +923,20 @@ class OptionChains(BaseModel, arbitrary_types_allowed=True):
             delta_max (float, optional): The maximum absolute delta value. Defaults to 0.97.
             price_min (int, optional): The minimum underlying price. Defaults to 10.
         """
-        self.chains = self.chains.loc[
-            (self.chains["open_interest"] > open_interest_threshold)
-            & (abs(self.chains["delta"]) > delta_min)
-            & (abs(self.chains["delta"]) < delta_max)
-            & (self.chains["underlying_price"] > price_min)
-        ].copy()
+        # one mask over the numpy columns, abs(delta) taken once
+        abs_delta = np.abs(self.chains["delta"].to_numpy())
+        mask = (
+            (self.chains["open_interest"].to_numpy() > open_interest_threshold)
+            & (abs_delta > delta_min)
+            & (abs_delta < delta_max)
+            & (self.chains["underlying_price"].to_numpy() > price_min)
+        )
+        # gather the kept rows by position, one take per column
+        self.chains = self.chains.take(np.flatnonzero(mask))
+        self.chains["underlying_symbol"] = self.chains["underlying_symbol"].cat.remove_unused_categories()
+        # symbol chains made before the purge are stale
+        self.symbol_chains = {}
+        self._symbol_rows = None
 
 
     def underlying_symbols(self):
@@ -808,7 +946,7 @@ class OptionChains(BaseModel, arbitrary_types_allowed=True):
         Returns:
             numpy.ndarray: An array of unique underlying symbols.
         """
-        return self.chains["underlying_symbol"].unique()
+        return self.chains["underlying_symbol"].cat.categories.to_numpy()
 
 
     def get_symbol_chain(self, symbol: str) -> OptionChainsSym:
@@ -822,10 +960,42 @@ class OptionChains(BaseModel, arbitrary_types_allowed=True):
             OptionChainsSym: An OptionChainsSym object for the symbol.
         """
         if symbol not in self.symbol_chains:
-            symbol_chain = filter_option_chains(self.chains, symbol=symbol)
+            if self._symbol_rows is None:
+                self._symbol_rows = self.chains.groupby("underlying_symbol", sort=False).indices
+            rows = self._symbol_rows.get(symbol, np.empty(0, dtype=np.intp))
+            symbol_chain = self.chains.take(rows)
             self.symbol_chains[symbol] = OptionChainsSym(chains=symbol_chain)
         return self.symbol_chains[symbol]
 
 
+    def batch_evaluate(self, symbols, strategy_fn, n_jobs: int = 1) -> dict:
+        """
+        Runs strategy_fn on the OptionChainsSym of each symbol, in this process or in worker processes.
+
+        strategy_fn gets a copy of the symbol chain on both paths, changes it makes
+        are not kept on the cached chains. With n_jobs > 1 it must be picklable (a module level function).
+        A pool only pays off when strategy_fn does seconds of work per symbol, pickling
+        each chain and starting the workers costs more than a typical calc_iv pass.
 
+        Args:
+            symbols (iterable): The underlying symbols.
+            strategy_fn (callable): Called as strategy_fn(OptionChainsSym), returns a picklable result.
+            n_jobs (int, optional): Worker processes, 1 (the default) runs in this process,
+                None or -1 for all cores.
 
+        Returns:
+            dict: strategy_fn result by symbol.
+        """
+        symbols = list(symbols)
+        if n_jobs is None or n_jobs < 1:
+            n_jobs = os.cpu_count() or 1
+        n_jobs = min(n_jobs, len(symbols))
+        symbol_chains = [self.get_symbol_chain(symbol) for symbol in symbols]
+        if n_jobs <= 1:
+            # workers get a pickled copy, match that here
+            return {symbol: strategy_fn(chain.model_copy(deep=True)) for symbol, chain in zip(symbols, symbol_chains)}
+        # few big chunks, pickling a chain costs more than the task switch
+        chunksize = max(1, len(symbols) // (n_jobs * 4))
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            results = pool.map(strategy_fn, symbol_chains, chunksize=chunksize)
+            return dict(zip(symbols, results))
@@ -7,16 +7,15 @@
 #
 
 import numpy as np
-from scipy.stats import norm
 import pandas as pd
 
-from pydantic import BaseModel, field_validator, ValidationError # type: ignore
+from pydantic import BaseModel, InstanceOf, PrivateAttr, field_validator, ValidationError # type: ignore
 from typing import List
 
-from .leg import OptionLeg
+from .greeks import black_scholes_vec
+from .leg import OptionLeg, OptionLegArrays
 from .pnl import OptionPnL
-from .plot import plot_strategy as _plot_stragey
-from .margin import MarginCalculator
+from .margin import MarginCalculator, LegShape, classify_legs
 from .utils import class_args, model_repr
 
 # use X std deviations for price range sampling
@@ -73,12 +72,24 @@ class OptionStrategy(BaseModel, arbitrary_types_allowed=True):
     num_simulations: int = NUM_SIMULATIONS
     r: float = R
     year_days: int = YEAR_DAYS
+    seed: int | None = None  # monte carlo random generator seed
+    antithetic: bool = True  # mirror half the monte carlo draws to cut variance
 
     # internal
     legs: List[OptionLeg] = []
-    pnls: List[OptionPnL] = []
+    pnls: List[InstanceOf[OptionPnL]] = []  # checked by isinstance, the pnls are not pydantic models
     days_to_expiration: float = None # will default DTE
     sigma: float = None  # will override vol calc from legs
+    _leg_arrays: OptionLegArrays | None = PrivateAttr(default=None)  # built by leg_arrays()
+    _leg_totals: tuple | None = PrivateAttr(default=None)  # built by leg_totals()
+    _option_legs: list | None = PrivateAttr(default=None)  # built by option_legs()
+    _stock_legs: list | None = PrivateAttr(default=None)  # built by stock_legs()
+    _option_shape: LegShape | None = PrivateAttr(default=None)  # built by option_shape()
+    # legs seen, option legs, dte sum, volatility sum - folded in as legs are added
+    _leg_sums: tuple = PrivateAttr(default=(0, 0, 0.0, 0.0))
+    _rng: np.random.Generator = PrivateAttr(default=None)
+    _Z: np.ndarray = PrivateAttr(default=None)  # reused standard normal draws
+    _unit_ramp: np.ndarray = PrivateAttr(default=None)  # built by unit_ramp()
 
 
     def __init__(self, **data):
@@ -88,6 +99,8 @@ class OptionStrategy(BaseModel, arbitrary_types_allowed=True):
             del data["volatility"]
         #del data["sigma"]
         super().__init__(**data)
+        self._rng = np.random.default_rng(self.seed)
+        self._Z = np.empty(self.num_simulations)
 
     def __repr__(self):
         return model_repr(self)
@@ -96,10 +109,7 @@ class OptionStrategy(BaseModel, arbitrary_types_allowed=True):
         """Model of key OptionPnL Stat Components"""
         cost, margin = self.margin()
         data = dict(self)
-        data["theta"] = self.theta()
-        data["delta"] = self.delta()
-        data["vega"] = self.vega()
-        data["gamma"] = self.gamma()
+        data["delta"], data["theta"], data["vega"], data["gamma"], _ = self.leg_totals()
         data["cost"] = cost
         data["margin"] = margin
         data["volatility"] = self.volatility()
@@ -112,11 +122,23 @@ class OptionStrategy(BaseModel, arbitrary_types_allowed=True):
         return OptionStrategyRepr(**data)
 
     def reset_pnl(self):
+        # legs changed, rebuild the leg partitions, column view and totals on next use
+        self._option_legs = None
+        self._stock_legs = None
+        self._option_shape = None
+        self._leg_arrays = None
+        self._leg_totals = None
         # update strategy days_to_expiration
         self.days_to_expiration = self.calc_current_dte()
         # clear pnls to be recalculated
         self.pnls = []
 
+    def reset_legs(self):
+        # legs edited in place or the list replaced, recount the dte/volatility sums too,
+        # appending through add_leg(s) only needs reset_pnl
+        self._leg_sums = (0, 0, 0.0, 0.0)
+        self.reset_pnl()
+
 
     # ________________________
     # Leg interactions
@@ -126,8 +148,10 @@ class OptionStrategy(BaseModel, arbitrary_types_allowed=True):
             legs: list[dict] | pd.DataFrame,
         ):
         if not isinstance(legs, list):
-            # make it a list from pandas
-            legs = legs.to_dict('records')
+            # make it a list from pandas, a column at a time and only the fields a leg takes,
+            # to_dict('records') goes row by row through every chain column
+            fields = [col for col in legs.columns if col in OptionLeg.model_fields]
+            legs = [dict(zip(fields, row)) for row in zip(*(legs[col].tolist() for col in fields))]
         for leg in legs:
             if leg['option_type'] == 'S':
                 if 'mark' in leg:
@@ -183,36 +207,106 @@ class OptionStrategy(BaseModel, arbitrary_types_allowed=True):
         )
         self.reset_pnl()
 
+    def leg_arrays(self) -> OptionLegArrays:
+        """Legs as parallel numpy arrays for vectorized pricing, cached until reset_pnl"""
+        if self._leg_arrays is None:
+            self._leg_arrays = OptionLegArrays.from_legs(self.legs)
+        return self._leg_arrays
+
+    def calc_all(self, underlying_price: float = None) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Model mark, delta, theta, vega and gamma per contract of every leg,
+        priced in one black_scholes_vec call over the leg arrays
+        Args:
+            underlying_price: (float) price to value the legs at, defaults to the strategy underlying_price
+        Returns: tuple of arrays in leg order, stock legs are worth the underlying with a delta of 1
+        """
+        if underlying_price is None:
+            underlying_price = self.underlying_price
+        legs = self.leg_arrays()
+        greeks = black_scholes_vec(underlying_price, legs.strikes, legs.dtes, legs.is_call, legs.vols, self.r)
+        stock = (underlying_price, 1.0, 0.0, 0.0, 0.0)
+        return tuple(np.where(legs.is_stock, value, greek) for value, greek in zip(stock, greeks))
+
+    def standard_normals(self) -> np.ndarray:
+        """Fill and return the strategy buffer of num_simulations standard normal draws,
+        the buffer is overwritten by the next call
+        """
+        n = self.num_simulations
+        if len(self._Z) != n:
+            self._Z = np.empty(n)
+        if not self.antithetic:
+            return self._rng.standard_normal(out=self._Z)
+        # antithetic pairs: the second half mirrors the first, so odd moments cancel
+        half = (n + 1) // 2
+        self._rng.standard_normal(out=self._Z[:half])
+        np.negative(self._Z[:n - half], out=self._Z[half:])
+        return self._Z
+
+    def unit_ramp(self) -> np.ndarray:
+        """num_simulations evenly spaced points from -1 to 1, the price range in stddev units"""
+        if self._unit_ramp is None or len(self._unit_ramp) != self.num_simulations:
+            self._unit_ramp = np.linspace(-1.0, 1.0, self.num_simulations)
+        return self._unit_ramp
+
+    def leg_totals(self) -> tuple[float, float, float, float, float]:
+        """delta, theta, vega, gamma and cost of the legs from one pass over the leg arrays,
+        cached until reset_pnl
+        """
+        if self._leg_totals is None:
+            legs = self.leg_arrays()
+            opt = ~legs.is_stock
+            # theta vega gamma count option legs only
+            theta, vega, gamma = np.stack((legs.thetas, legs.vegas, legs.gammas))[:, opt] @ legs.quantities[opt]
+            # raw sum outlay for position, options by the 100
+            outlay = legs.quantities * legs.marks
+            cost = outlay[opt].sum() * 100 + outlay[legs.is_stock].sum()
+            self._leg_totals = (
+                float(legs.quantities @ legs.deltas),
+                float(theta), float(vega), float(gamma), float(cost),
+            )
+        return self._leg_totals
+
     def delta(self) -> float:
         """Calculate sum delta in the legs"""
-        return sum(leg.delta * leg.quantity for leg in self.legs)
+        return self.leg_totals()[0]
 
     def theta(self) -> float:
-        """Calculate sum delta in the legs"""
-        return sum(leg.theta * leg.quantity for leg in self.option_legs())
+        """Calculate sum theta in the option legs"""
+        return self.leg_totals()[1]
     
     def vega(self) -> float:
-        """Calculate sum delta in the legs"""
-        return sum(leg.vega * leg.quantity for leg in self.option_legs())
+        """Calculate sum vega in the option legs"""
+        return self.leg_totals()[2]
 
     def gamma(self) -> float:
-        """Calculate sum delta in the legs"""
-        return sum(leg.gamma * leg.quantity for leg in self.option_legs())
+        """Calculate sum gamma in the option legs"""
+        return self.leg_totals()[3]
 
     def cost(self) -> float:
-        """Calculate sum delta in the legs"""
-        # return raw sum outlay for position
-        opt_sum = sum(leg.mark * leg.quantity for leg in self.option_legs()) * 100
-        stk_sum = sum(leg.mark * leg.quantity for leg in self.stock_legs())
-        return opt_sum + stk_sum
+        """Calculate sum outlay of the legs"""
+        return self.leg_totals()[4]
+
+    def option_leg_sums(self) -> tuple[int, float, float]:
+        """count, days_to_expiration sum and volatility sum of the option legs,
+        only legs added since the last call are folded in, recounted after reset_legs
+        """
+        seen, count, dte_sum, vol_sum = self._leg_sums
+        if seen > len(self.legs):
+            # legs were replaced, start over
+            seen, count, dte_sum, vol_sum = 0, 0, 0.0, 0.0
+        for leg in self.legs[seen:]:
+            if leg.option_type != 'S':
+                count += 1
+                dte_sum += leg.days_to_expiration
+                vol_sum += leg.volatility
+        self._leg_sums = (len(self.legs), count, dte_sum, vol_sum)
+        return count, dte_sum, vol_sum
 
     def calc_current_dte(self) -> float:
         """Return average days_to_expire in the legs"""
-        option_legs = self.option_legs()
-        if len(option_legs) > 0:
-            return sum(
-                leg.days_to_expiration for leg in self.option_legs()
-            )/len(option_legs)
+        count, dte_sum, _ = self.option_leg_sums()
+        if count > 0:
+            return dte_sum / count
         else:
             return 1.0
 
@@ -220,20 +314,30 @@ class OptionStrategy(BaseModel, arbitrary_types_allowed=True):
         """Calculate volatitility as average of the volatility in the legs
         or user may override with __init__( volatility = .x )
         """
-        option_legs = self.option_legs()
-        if len(option_legs) > 0:
-            return sum(leg.volatility for leg in option_legs) / len(option_legs)
+        count, _, vol_sum = self.option_leg_sums()
+        if count > 0:
+            return vol_sum / count
         if self.sigma is not None and self.sigma > 0:
             return self.sigma
         return 0.22  # if all else none , 22 is fair
     
     def option_legs(self) -> List[OptionLeg]:
         """Returns a list of option legs, excluding underlying stock legs."""
-        return [leg for leg in self.legs if leg.option_type != 'S']
+        if self._option_legs is None:
+            self._option_legs = [leg for leg in self.legs if leg.option_type != 'S']
+        return self._option_legs
 
     def stock_legs(self) -> List[OptionLeg]:
-        """Returns a list of option legs, excluding underlying stock legs."""
-        return [leg for leg in self.legs if leg.option_type == 'S']
+        """Returns a list of the underlying stock legs."""
+        if self._stock_legs is None:
+            self._stock_legs = [leg for leg in self.legs if leg.option_type == 'S']
+        return self._stock_legs
+
+    def option_shape(self) -> LegShape:
+        """Margin shape of the option legs ( spread, iron condor, .. ), cached until reset_pnl"""
+        if self._option_shape is None:
+            self._option_shape = classify_legs(self.option_legs())
+        return self._option_shape
     # ________________________
     # pnl interactions
 
@@ -288,7 +392,7 @@ class OptionStrategy(BaseModel, arbitrary_types_allowed=True):
             self.add_pnl()
         if idx >= len(self.pnls):
             raise ValueError(f"Pnl Attr idx:{idx} move must index valid pnl object")
-        return dict(self.pnls[idx])[key]
+        return getattr(self.pnls[idx], key)
 
     def expected_move(self, idx: int = 0) -> float:
         # alias to stddev 
@@ -317,13 +421,17 @@ class OptionStrategy(BaseModel, arbitrary_types_allowed=True):
 
     # ________________________
     # plot interactions
-    def plot_strategy(self, savefig: str = None, show=True):
+    def plot_strategy(self, savefig: str = None, show=True, dpi: int = 150, fig_state: dict = None) -> dict:
         """ Plot the strategy, 
         Args:
             savefig: (str)  filename to save plot to 
             show: (bool) set to False if you do not want display (to write file only)
+            dpi: (int) resolution of the rasterized pnl curves in the saved file
+            fig_state: (dict) returned by an earlier plot, to redraw that figure in place
         """
-        _plot_stragey(self, savefig=savefig, show=show)
+        # matplotlib is only imported once something is plotted
+        from .plot import plot_strategy as _plot_stragey
+        return _plot_stragey(self, savefig=savefig, show=show, dpi=dpi, fig_state=fig_state)
     
     # ________________________
     # margin interactions
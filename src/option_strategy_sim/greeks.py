@@ -7,23 +7,195 @@
 #
 
 
+import math
+from dataclasses import dataclass
+from functools import lru_cache
 import numpy as np
-from scipy.stats import norm
-from pydantic import BaseModel, field_validator, model_validator
+from scipy.special import ndtr
+
+from .utils import njit, prange, HAS_NUMBA
 
 
 # days in the year for stddev calc, some ppl like 255 or 251 trade days instead of 365
 YEAR_DAYS = 365
 # our risk free rate
 R = 0.05
+# 1/sqrt(2) and 1/sqrt(2*pi) for the normal cdf/pdf
+_SQRT1_2 = 1.0 / math.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+# below this sigma * sqrt(T) the zero volatility limit ( forward intrinsic value ) is used
+_MIN_SIGMA_T = 1e-12
+# implied volatility search bracket, initial guess floor and vega floor
+_IV_MIN = 1e-4
+_IV_MAX = 5.0
+_IV_GUESS_MIN = 0.05
+_MIN_VEGA = 1e-8
+# memoized evaluations, strategies revalue the same legs for every pnl and plot
+_CACHE_SIZE = 4096
 
 def expected_move(underlying_price:float, volatility: float, days_to_expiration: float) -> float:
     """Calculate expected move of underlying for given volatility and duration"""
     if days_to_expiration > 0:
-        return underlying_price * volatility * np.sqrt(days_to_expiration / 365)
+        return underlying_price * volatility * math.sqrt(days_to_expiration / 365)
     return 0
 
 
+@njit(cache=True, fastmath=True)
+def _ncdf(x: float) -> float:
+    """Standard normal cumulative distribution"""
+    return 0.5 * math.erfc(-x * _SQRT1_2)
+
+
+@njit(cache=True, fastmath=True)
+def _npdf(x: float) -> float:
+    """Standard normal probability density"""
+    return math.exp(-0.5 * x * x) * _INV_SQRT_2PI
+
+
+@njit(inline='always', fastmath=True)
+def _ncdf_poly(x: float) -> float:
+    """Standard normal cumulative distribution, Abramowitz & Stegun 26.2.17 polynomial
+    absolute error under 7.5e-8, for price grids where the erfc precision is not needed
+    """
+    ax = abs(x)
+    t = 1.0 / (1.0 + 0.2316419 * ax)
+    poly = t * (0.319381530 + t * (-0.356563782 + t * (1.781477937 + t * (-1.821255978 + t * 1.330274429))))
+    upper = math.exp(-0.5 * ax * ax) * _INV_SQRT_2PI * poly
+    # the polynomial is for x >= 0, the lower half follows from symmetry
+    return 1.0 - upper if x >= 0 else upper
+
+
+@njit(cache=True, fastmath=True)
+def _bs_all(S: float, K: float, T: float, r: float, sigma: float, phi: float) -> tuple:
+    """Numeric Black-Scholes kernel for T > 0 (years), one evaluation of d1/d2/pdf(d1)
+    phi is 1 for a call and -1 for a put
+    returns mark, delta, theta, vega, gamma
+    theta is the closed form time decay per year with the strike discount held,
+    -S * pdf(d1) * sigma / (2 * sqrt(T))
+    """
+    K_disc: float = K * math.exp(-r * T)
+    if S <= 0:
+        # limit as the underlying goes to 0, worthless call or fully in the money put
+        return max(-phi * K_disc, 0.0), 0.5 * (phi - 1.0), 0.0, 0.0, 0.0
+    # log1p keeps log(S/K) accurate at the money
+    log_SK: float = math.log1p((S - K) / K)
+    sqrt_T: float = math.sqrt(T)
+    sigma_T: float = sigma * sqrt_T
+    if sigma_T < _MIN_SIGMA_T:
+        # zero volatility limit, the forward intrinsic value with a step delta
+        if phi * (log_SK + r * T) > 0:
+            return phi * (S - K_disc), phi, 0.0, 0.0, 0.0
+        return 0.0, 0.0, 0.0, 0.0, 0.0
+    inv_sigma_T: float = 1.0 / sigma_T
+    d1 = (log_SK + (r + 0.5 * sigma**2) * T) * inv_sigma_T
+    d2 = d1 - sigma_T
+    cdf_d1: float = _ncdf(phi * d1)
+    mark = phi * (S * cdf_d1 - K_disc * _ncdf(phi * d2))
+    delta = phi * cdf_d1
+    pdf_d1: float = _npdf(d1)
+    vega: float = S * pdf_d1 * sqrt_T
+    gamma: float = pdf_d1 * inv_sigma_T / S
+    theta: float = -0.5 * vega * sigma / T
+    return mark, delta, theta, vega, gamma
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _pnl_grid(
+    S_arr: np.ndarray,
+    T_arr: np.ndarray,
+    K_arr: np.ndarray,
+    vol_arr: np.ndarray,
+    phi_arr: np.ndarray,
+    units_arr: np.ndarray,
+    basis_arr: np.ndarray,
+    r: float,
+) -> np.ndarray:
+    """Strategy PnL over a grid of times (years) by underlying prices, summed over the legs
+    leg phi is 1 for a call, -1 for a put and 0 for stock; legs past expiration take intrinsic value
+    returns an array shaped (len(T_arr), len(S_arr))
+    """
+    n_T = T_arr.shape[0]
+    n_S = S_arr.shape[0]
+    n_legs = K_arr.shape[0]
+    # everything but the price is fixed per (time, leg), specialize those once
+    sigma_T = np.empty((n_T, n_legs))
+    inv_sigma_T = np.empty((n_T, n_legs))
+    drift = np.empty((n_T, n_legs))
+    K_disc = np.empty((n_T, n_legs))
+    log_K = np.log(K_arr)
+    for t in range(n_T):
+        T = max(T_arr[t], 0.0)
+        sqrt_T = math.sqrt(T)
+        disc = math.exp(-r * T)
+        for j in range(n_legs):
+            sigma = vol_arr[j]
+            sigma_T[t, j] = sigma * sqrt_T
+            inv_sigma_T[t, j] = 1.0 / max(sigma_T[t, j], _MIN_SIGMA_T)
+            drift[t, j] = (r + 0.5 * sigma * sigma) * T
+            K_disc[t, j] = K_arr[j] * disc
+
+    pnl = np.zeros((n_T, n_S))
+    for i in prange(n_S):
+        S = S_arr[i]
+        log_S = math.log(S) if S > 0 else 0.0
+        for t in range(n_T):
+            expired = T_arr[t] <= 0
+            total = 0.0
+            for j in range(n_legs):
+                phi = phi_arr[j]
+                if phi == 0:
+                    value = S
+                elif expired:
+                    value = max(phi * (S - K_arr[j]), 0.0)
+                elif S <= 0:
+                    value = max(-phi * K_disc[t, j], 0.0)
+                elif sigma_T[t, j] < _MIN_SIGMA_T:
+                    # zero volatility limit, as in _bs_all
+                    value = phi * (S - K_disc[t, j]) if phi * (log_S - log_K[j] + drift[t, j]) > 0 else 0.0
+                else:
+                    # _bs_all mark with the polynomial cdf
+                    d1 = (log_S - log_K[j] + drift[t, j]) * inv_sigma_T[t, j]
+                    d2 = d1 - sigma_T[t, j]
+                    value = phi * (S * _ncdf_poly(phi * d1) - K_disc[t, j] * _ncdf_poly(phi * d2))
+                total += (value - basis_arr[j]) * units_arr[j]
+            pnl[t, i] = total
+    return pnl
+
+
+def _bs_mark_vec(
+    S: np.ndarray, K: np.ndarray, T: float, r: float, sigma: np.ndarray, phi: np.ndarray
+) -> np.ndarray:
+    """Black-Scholes mark for T > 0 (years), inputs broadcast against each other
+    so a column of prices can be priced over a row of legs in one evaluation
+    phi is 1 for a call and -1 for a put
+    """
+    # prices at or below 0 take the S -> 0 limit, as in _bs_all
+    S = np.maximum(S, 0.0)
+    sigma_T = np.asarray(sigma, dtype=float) * math.sqrt(T)
+    K_disc = K * math.exp(-r * T)
+    with np.errstate(divide='ignore'):
+        moneyness = np.log(S / K) + (r + 0.5 * np.square(sigma)) * T
+    # zero volatility limit, as in _bs_all
+    zero_vol = sigma_T < _MIN_SIGMA_T
+    d1 = moneyness / np.where(zero_vol, 1.0, sigma_T)
+    d2 = d1 - sigma_T
+    mark = phi * (S * ndtr(phi * d1) - K_disc * ndtr(phi * d2))
+    return np.where(zero_vol, np.where(phi * moneyness > 0, phi * (S - K_disc), 0.0), mark)
+
+
+@njit(cache=True, fastmath=True)
+def _bs_core(S: float, K: float, T: float, r: float, sigma: float, phi: float, theta_days: float) -> tuple:
+    """Numeric Black-Scholes kernel for T > 0 (years)
+    phi is 1 for a call and -1 for a put
+    returns mark, delta, theta, vega, gamma
+    """
+    mark, delta, theta, vega, gamma = _bs_all(S, K, T, r, sigma, phi)
+    # theta as the mark change over theta_days, per year of time left
+    theta = theta * theta_days / YEAR_DAYS / T
+    return mark, delta, theta, vega, gamma
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
 def black_scholes(
     underlying_price: float,
     strike_price: float,
@@ -53,7 +225,9 @@ def black_scholes(
     	    - gamma (float):
     Notes:
         - If time to expiration (T) is zero or negative, the function returns the intrinsic value of the option and a delta of 0.
-        - Theta is calculated as the difference in option price between the current time and a time `theta_days` in the future.
+        - Theta is the closed form Black-Scholes theta over `theta_days`, divided by the time left in years.
+        - The numeric work is done in `_bs_core`, compiled by numba when installed.
+        - Results are memoized on the exact arguments, see `clear_greeks_cache`.
     """
     if underlying_price is None:
         raise ValueError("underlying_price is required")
@@ -67,8 +241,6 @@ def black_scholes(
         raise ValueError("volatility is required")
 
     T: float = time_days / YEAR_DAYS
-    T_next: float = (time_days - 1) / YEAR_DAYS
-    thetadiff: float = theta_days / YEAR_DAYS
 
     if T <= 0:
         return (
@@ -80,39 +252,81 @@ def black_scholes(
             0,
             0,
         )
-    def bs_greeks(tyear:float, justmark: bool = False) -> tuple:
-        sigma_T:float = volatility * np.sqrt(tyear)
-        if sigma_T == 0:
-            sigma_T = np.sqrt(0.1/365)
-        d1 = (
-            np.log(underlying_price / strike_price)
-            + (r + 0.5 * volatility**2) * tyear
-        ) / sigma_T
+    if option_type not in ("C", "P"):
+        raise ValueError("Invalid option type. Use 'C' or 'P'.")
+    # cast once so the jit kernel keeps a single compiled signature
+    return _bs_core(
+        float(underlying_price),
+        float(strike_price),
+        float(T),
+        float(r),
+        float(volatility),
+        1.0 if option_type == "C" else -1.0,
+        float(theta_days),
+    )
+
+def black_scholes_vec(
+    underlying_price: float | np.ndarray,
+    strike_price: float | np.ndarray,
+    time_days: float | np.ndarray,
+    is_call: bool | np.ndarray,
+    volatility: float | np.ndarray,
+    r: float = R,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized black_scholes, the arguments broadcast against each other
+    so a batch of legs ( or a grid of prices ) is priced in one call.
+    Returns:
+        tuple[np.ndarray, ...]: mark, delta, theta, vega, gamma for each broadcast point,
+        expired contracts get their intrinsic value and a nan theta
+    """
+    S, K, time_days, is_call, sigma = np.broadcast_arrays(
+        np.asarray(underlying_price, dtype=float),
+        np.asarray(strike_price, dtype=float),
+        np.asarray(time_days, dtype=float),
+        np.asarray(is_call, dtype=bool),
+        np.asarray(volatility, dtype=float),
+    )
+    phi = np.where(is_call, 1.0, -1.0)
+    T = time_days / YEAR_DAYS
+    expired = T <= 0
+    # expired contracts are filled in at the end, price them at any T > 0 meanwhile
+    T = np.where(expired, 1.0, T)
+    sqrt_T = np.sqrt(T)
+    sigma_T = sigma * sqrt_T
+    K_disc = K * np.exp(-r * T)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_SK = np.log1p((S - K) / K)
+        zero_vol = sigma_T < _MIN_SIGMA_T
+        d1 = (log_SK + (r + 0.5 * sigma**2) * T) / np.where(zero_vol, 1.0, sigma_T)
         d2 = d1 - sigma_T
-        if option_type == "C":
-            mark = (
-                underlying_price * norm.cdf(d1) - strike_price * np.exp(-r * T) * norm.cdf(d2)
-            )
-            delta = norm.cdf(d1)  # Correct delta for a call option
-        elif option_type == "P":
-            mark = (
-                strike_price * np.exp(-r * T) * norm.cdf(-d2)
-                - underlying_price * norm.cdf(-d1)
-            )
-            delta = norm.cdf(d1) - 1  # Correct delta for a put option
-        else:
-            raise ValueError("Invalid option type. Use 'C' or 'P'.")
-        if justmark:
-            return mark
-        vega: float = underlying_price * norm.pdf(d1) * np.sqrt(T)
-        gamma: float = norm.pdf(d1) / (underlying_price * volatility * np.sqrt(T))
-        return mark, delta, vega, gamma
-    
-    thetadiff:float  = time_days / YEAR_DAYS
-    mark, delta, vega, gamma = bs_greeks(thetadiff)    
-    next_mark = bs_greeks((time_days - 1) / YEAR_DAYS, justmark=True)
-    theta = (next_mark - mark) / thetadiff
-    return mark, delta, theta, vega, gamma
+        cdf_d1 = ndtr(phi * d1)
+        mark = phi * (S * cdf_d1 - K_disc * ndtr(phi * d2))
+        delta = phi * cdf_d1
+        pdf_d1 = np.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+        vega = S * pdf_d1 * sqrt_T
+        gamma = pdf_d1 / (sigma_T * S)
+        theta = -0.5 * vega * sigma / T
+    # zero volatility limit, the forward intrinsic value with a step delta
+    in_money = phi * (log_SK + r * T) > 0
+    mark = np.where(zero_vol, np.where(in_money, phi * (S - K_disc), 0.0), mark)
+    delta = np.where(zero_vol, np.where(in_money, phi, 0.0), delta)
+    # limit as the underlying goes to 0, worthless call or fully in the money put
+    no_price = S <= 0
+    mark = np.where(no_price, np.maximum(-phi * K_disc, 0.0), mark)
+    delta = np.where(no_price, 0.5 * (phi - 1.0), delta)
+    flat = zero_vol | no_price
+    vega = np.where(flat, 0.0, vega)
+    gamma = np.where(flat, 0.0, gamma)
+    # one day of theta per year of time left, as in _bs_core
+    theta = np.where(flat, 0.0, theta) / YEAR_DAYS / T
+    return (
+        np.where(expired, np.maximum(phi * (S - K), 0.0), mark),
+        np.where(expired, 0.0, delta),
+        np.where(expired, np.nan, theta),
+        np.where(expired, 0.0, vega),
+        np.where(expired, 0.0, gamma),
+    )
 
 def black_scholes_vega(
     underlying_price: float,
@@ -121,20 +335,21 @@ def black_scholes_vega(
     volatility: float,
     r: float = R,
 ) -> float:
-    """Calculates the Vega of a European option."""
+    """Calculates the Vega of a European option.
+    Kept for compatibility, black_scholes or Greeks return vega with the other greeks
+    from the same d1/d2 evaluation.
+    """
     T = time_days / YEAR_DAYS
-    sigma_T = volatility * np.sqrt(T)
     if T <= 0:
         return 0
-    d1 = (
-        np.log(underlying_price / strike_price)
-        + (r + 0.5 * volatility**2) * T
-    ) / sigma_T
-    return underlying_price * norm.pdf(d1) * np.sqrt(T)
+    # vega is the same for calls and puts
+    return _bs_all(float(underlying_price), float(strike_price), T, float(r), float(volatility), 1.0)[3]
 
 def black_scholes_gamma(underlying_price: float, strike_price: float, time_days: float,  volatility: float, r: float = R):
     """
     Calculates the Gamma of a European option using the Black-Scholes formula.
+    Kept for compatibility, black_scholes or Greeks return gamma with the other greeks
+    from the same d1/d2 evaluation.
 
     Args:
         S (float): Current price of the underlying asset.
@@ -147,9 +362,87 @@ def black_scholes_gamma(underlying_price: float, strike_price: float, time_days:
         float: Gamma of the option.
     """
     T: float = time_days / YEAR_DAYS
-    d1: float = (np.log(underlying_price / strike_price) + (r + 0.5 * volatility ** 2) * T) / (volatility * np.sqrt(T))
-    return norm.pdf(d1) / (underlying_price * volatility * np.sqrt(T))
+    if T <= 0:
+        return 0
+    # gamma is the same for calls and puts
+    return _bs_all(float(underlying_price), float(strike_price), T, float(r), float(volatility), 1.0)[4]
 
+# no fastmath here, the nan / bracket guards rely on IEEE comparisons
+@njit(cache=True)
+def _iv_solve(
+    S: float, K: float, T: float, r: float, mark: float, phi: float,
+    volatility: float, tolerance: float, max_iterations: int,
+) -> float:
+    """Safeguarded Newton-Raphson volatility search, nan when it does not converge
+    steps are taken on log price, which is close to linear in sigma on the wings
+    where the plain price is convex and newton overshoots, with halley's correction
+    from vomma ( vega * d1 * d2 / sigma ) for third order convergence
+    """
+    # written so nan fails each test, inf fails the upper bound
+    if not (0 < S < math.inf and 0 < K < math.inf and 0 < T < math.inf and 0 < mark < math.inf):
+        return math.nan
+    log_mark = math.log(mark)
+    # invariants of sigma, each step is then one sqrt free d1/d2 and two cdfs
+    log_SK = math.log(S / K)
+    sqrt_T = math.sqrt(T)
+    disc_K = K * math.exp(-r * T)
+    r_T = r * T
+    # no volatility prices outside the no-arbitrage bounds, give up without iterating
+    floor = max(phi * (S - disc_K), 0.0)
+    ceiling = S if phi > 0 else disc_K
+    if mark < floor - tolerance or mark > ceiling + tolerance:
+        return math.nan
+    lo, hi = _IV_MIN, _IV_MAX
+    volatility = min(max(volatility, lo), hi)
+    for _ in range(max_iterations):
+        sigma_T = volatility * sqrt_T
+        d1 = (log_SK + r_T + 0.5 * sigma_T * sigma_T) / sigma_T
+        d2 = d1 - sigma_T
+        calculated_price = phi * (S * _ncdf(phi * d1) - disc_K * _ncdf(phi * d2))
+        price_diff = calculated_price - mark
+        if abs(price_diff) < tolerance:
+            return volatility
+        vega = S * _npdf(d1) * sqrt_T
+        # price rises with volatility, so the diff sign narrows the bracket
+        if price_diff > 0:
+            hi = volatility
+        else:
+            lo = volatility
+        if vega > _MIN_VEGA:
+            # f = log price - log mark, f' = vega / price, f'' = vomma / price - f'^2
+            price = max(calculated_price, 1e-300)
+            f = math.log(price) - log_mark
+            f1 = vega / price
+            f2 = vega * d1 * d2 / volatility / price - f1 * f1
+            halley = 2 * f1 * f1 - f * f2
+            if halley > 0:
+                next_volatility = volatility - 2 * f * f1 / halley
+            else:
+                next_volatility = volatility - f / f1
+        else:
+            next_volatility = hi
+        if not lo < next_volatility < hi:
+            next_volatility = 0.5 * (lo + hi)
+        volatility = next_volatility
+    return math.nan
+
+
+@njit(parallel=True, cache=True)
+def _iv_batch(
+    S: np.ndarray, K: np.ndarray, T: np.ndarray, r: float, mark: np.ndarray, phi: np.ndarray,
+    volatility: np.ndarray, tolerance: float, max_iterations: int,
+) -> np.ndarray:
+    """_iv_solve over contract arrays, one contract per parallel iteration, nan where it fails"""
+    n = K.shape[0]
+    implied = np.full(n, np.nan)
+    for i in prange(n):
+        # nan inputs fail the comparisons and keep their nan
+        if T[i] > 0 and S[i] > 0 and mark[i] > 0:
+            implied[i] = _iv_solve(S[i], K[i], T[i], r, mark[i], phi[i], volatility[i], tolerance, max_iterations)
+    return implied
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
 def implied_volatility_newton_raphson(
     underlying_price: float,
     strike_price: float,
@@ -157,34 +450,147 @@ def implied_volatility_newton_raphson(
     mark: float,
     option_type: str,
     r: float = R,
-    initial_volatility: float = 0.2,
+    initial_volatility: float | None = None,
     tolerance: float = 1e-6,
     max_iterations: int = 100,
 ) -> tuple[float, float, float, float, float] | None:
     """Calculates implied volatility using Newton-Raphson method.
     returns volatility, delta , theta, vega
+
+    Marks outside the no-arbitrage bounds, below intrinsic value or above the
+    underlying (calls) / discounted strike (puts), return None without iterating.
+    Without an initial_volatility, the search starts at the inflection point of
+    the price/volatility curve, sigma_c = sqrt(|2/T * (ln(K/S) + rT)|), which sits
+    in the Newton-Raphson convergence basin.
+    Steps use Halley's correction from vomma, which typically saves two iterations.
+    The solution is kept in a [_IV_MIN, _IV_MAX] bracket; when a Newton step
+    would leave the bracket, or vega vanishes, a bisection step is taken instead.
+    Results are memoized on the exact arguments, see `clear_greeks_cache`.
     """
-    volatility = initial_volatility
-    for _ in range(max_iterations):
-        calculated_price, delta, theta, vega, gamma = black_scholes(
-            underlying_price=underlying_price,
-            strike_price=strike_price,
-            time_days=time_days,
-            r=r,
-            volatility=volatility,
-            option_type=option_type,
+    T: float = time_days / YEAR_DAYS
+    if T <= 0:
+        return None
+    if initial_volatility is None:
+        initial_volatility = max(
+            math.sqrt(abs(2 / T * (math.log(strike_price / underlying_price) + r * T))),
+            _IV_GUESS_MIN,
         )
-        price_diff = calculated_price - mark
-        if vega == 0:
-            return None
-        if abs(price_diff) < tolerance:
-            return volatility, delta, theta, vega, gamma
-        volatility = volatility - price_diff / vega
-        if volatility < 0:
-            return None  # volatility should never be negative.
+    if option_type not in ("C", "P"):
+        raise ValueError("Invalid option type. Use 'C' or 'P'.")
+    S, K, r = float(underlying_price), float(strike_price), float(r)
+    phi = 1.0 if option_type == "C" else -1.0
+    volatility = _iv_solve(
+        S, K, T, r, float(mark), phi, float(initial_volatility), float(tolerance), int(max_iterations))
+    if math.isnan(volatility):
+        return None  # Did not converge
+    # greeks only once converged
+    _, delta, theta, vega, gamma = _bs_core(S, K, T, r, volatility, phi, 1.0)
+    return volatility, delta, theta, vega, gamma
+
+def implied_volatility_newton_raphson_vec(
+    underlying_price: float | np.ndarray,
+    strike_price: np.ndarray,
+    time_days: float | np.ndarray,
+    mark: np.ndarray,
+    is_call: bool | np.ndarray,
+    r: float = R,
+    initial_volatility: float | None = None,
+    tolerance: float = 1e-6,
+    max_iterations: int = 100,
+) -> np.ndarray:
+    """Calculates implied volatility for a slice of an option chain using Newton-Raphson,
+    iterating all contracts at once with numpy, or in the parallel _iv_batch kernel with numba.
+    Each contract follows _iv_solve: marks outside the no-arbitrage bounds are skipped,
+    the search starts at the inflection point of its price/volatility curve, unless an
+    initial_volatility is given, and steps that leave the [_IV_MIN, _IV_MAX] bracket
+    become bisection steps.
+
+    Args:
+        underlying_price (float | np.ndarray): price of the underlying
+        strike_price (np.ndarray): contract strikes
+        time_days (float | np.ndarray): days to expiration
+        mark (np.ndarray): contract market prices
+        is_call (bool | np.ndarray): True for calls, False for puts
+    Returns:
+        np.ndarray: volatility per contract, nan where the solve fails
+    """
+    S, K, time_days, mark, is_call = np.broadcast_arrays(
+        np.asarray(underlying_price, dtype=float),
+        np.asarray(strike_price, dtype=float),
+        np.asarray(time_days, dtype=float),
+        np.asarray(mark, dtype=float),
+        np.asarray(is_call, dtype=bool),
+    )
+    T = time_days / YEAR_DAYS
+    phi = np.where(is_call, 1.0, -1.0)
+    if HAS_NUMBA:
+        # compiled, one contract at a time across the cores
+        if initial_volatility is None:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                seed = np.maximum(np.sqrt(np.abs(2 / T * (r * T - np.log(S / K)))), _IV_GUESS_MIN)
+        else:
+            seed = np.full(K.shape, initial_volatility, dtype=float)
+        return _iv_batch(
+            S.ravel(), K.ravel(), T.ravel(), float(r), mark.ravel(), phi.ravel(),
+            seed.ravel(), float(tolerance), int(max_iterations)).reshape(K.shape)
+
+    implied = np.full(K.shape, np.nan)
 
-    return None  # Did not converge
+    # marks outside the no-arbitrage bounds have no volatility, as in _iv_solve
+    K_disc = K * np.exp(-r * T)
+    floor = np.maximum(phi * (S - K_disc), 0.0)
+    ceiling = np.where(is_call, S, K_disc)
+    priced = (mark >= floor - tolerance) & (mark <= ceiling + tolerance)
 
+    # iterate only the contracts still searching, compacted to their own arrays
+    idx = np.flatnonzero((T > 0) & (S > 0) & (mark > 0) & priced)
+    S, K, T, mark, phi = S.ravel()[idx], K.ravel()[idx], T.ravel()[idx], mark.ravel()[idx], phi.ravel()[idx]
+    sqrt_T = np.sqrt(T)
+    K_disc = K_disc.ravel()[idx]
+    log_SK = np.log(S / K)
+    log_mark = np.log(mark)
+    if initial_volatility is None:
+        volatility = np.maximum(np.sqrt(np.abs(2 / T * (r * T - log_SK))), _IV_GUESS_MIN)
+    else:
+        volatility = np.full(idx.shape, initial_volatility, dtype=float)
+    lo = np.full(idx.shape, _IV_MIN)
+    hi = np.full(idx.shape, _IV_MAX)
+    volatility = np.clip(volatility, lo, hi)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for _ in range(max_iterations):
+            if idx.size == 0:
+                break
+            # price and vega share d1
+            sigma_T = volatility * sqrt_T
+            d1 = (log_SK + r * T + 0.5 * sigma_T * sigma_T) / sigma_T
+            d2 = d1 - sigma_T
+            price = phi * (S * ndtr(phi * d1) - K_disc * ndtr(phi * d2))
+            vega = S * np.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI * sqrt_T
+            price_diff = price - mark
+            converged = np.abs(price_diff) < tolerance
+            implied.ravel()[idx[converged]] = volatility[converged]
+            # price rises with volatility, so the diff sign narrows the bracket
+            high = price_diff > 0
+            hi = np.where(high, volatility, hi)
+            lo = np.where(high, lo, volatility)
+            # halley on log price, as in _iv_solve
+            price = np.maximum(price, 1e-300)
+            f = np.log(price) - log_mark
+            f1 = vega / price
+            f2 = vega * d1 * d2 / volatility / price - f1 * f1
+            halley = 2 * f1 * f1 - f * f2
+            step = np.where(halley > 0, volatility - 2 * f * f1 / halley, volatility - f / f1)
+            step = np.where(vega > _MIN_VEGA, step, hi)
+            # steps out of the bracket bisect it instead
+            volatility = np.where((lo < step) & (step < hi), step, 0.5 * (lo + hi))
+            keep = ~converged
+            idx, volatility, lo, hi = idx[keep], volatility[keep], lo[keep], hi[keep]
+            S, T, sqrt_T, K_disc, log_SK, log_mark, mark, phi = (
+                S[keep], T[keep], sqrt_T[keep], K_disc[keep], log_SK[keep], log_mark[keep], mark[keep], phi[keep])
+    # contracts still searching did not converge, left as nan
+    return implied
+
+@lru_cache(maxsize=_CACHE_SIZE)
 def calculate_price_probability(
     underlying_price: float,
     strike_price: float,
@@ -204,18 +610,65 @@ def calculate_price_probability(
     Returns:
         float: The probability (between 0 and 1) of the stock price reaching or exceeding the target price within the given time.
     """
+    # scalars, math avoids the numpy ufunc dispatch
     time_years = time_days / YEAR_DAYS
-    sigma_T = volatility * np.sqrt(time_years)
+    sigma_T = volatility * math.sqrt(time_years)
     r_T = r * time_years
-    d2 = (np.log(underlying_price / strike_price) + (r_T - 0.5 * sigma_T**2)) / sigma_T
-    probability = norm.cdf(d2)
+    drift = math.log(underlying_price / strike_price) + r_T - 0.5 * sigma_T**2
+    if sigma_T < _MIN_SIGMA_T:
+        # zero volatility limit, the forward price either reaches the strike or not
+        return 1.0 if drift > 0 else 0.0
+    probability = _ncdf(drift / sigma_T)
     return probability
 
 
+def calculate_price_probability_vec(
+    underlying_price: float | np.ndarray,
+    strike_price: float | np.ndarray,
+    time_days: float | np.ndarray,
+    volatility: float | np.ndarray,
+    r: float = R,
+) -> np.ndarray:
+    """
+    Vectorized calculate_price_probability, the arguments broadcast against each other
+    so a whole grid of strike ( or target ) prices is evaluated in one call.
+    Returns:
+        np.ndarray: The probability (between 0 and 1) for each broadcast point.
+    """
+    time_years = np.asarray(time_days, dtype=float) / YEAR_DAYS
+    sigma_T = np.asarray(volatility, dtype=float) * np.sqrt(time_years)
+    d2 = (np.log(np.asarray(underlying_price, dtype=float) / strike_price) + (r * time_years - 0.5 * sigma_T**2)) / sigma_T
+    return ndtr(d2)
+
+
+def precompile_kernels() -> None:
+    """Compile every numba kernel once so it is written to the on-disk cache,
+    later runs load the compiled kernels instead of compiling on first call.
+    A no-op without numba.
+    """
+    S, K, T, r, sigma = 100.0, 100.0, 30 / YEAR_DAYS, R, 0.2
+    for phi in (1.0, -1.0):
+        _bs_core(S, K, T, r, sigma, phi, 1.0)
+        _iv_solve(S, K, T, r, 2.5, phi, sigma, 1e-6, 100)
+    legs = np.array([K])
+    _pnl_grid(np.array([S]), np.array([T]), legs, np.array([sigma]), np.array([1.0]), legs, legs, r)
+    _iv_batch(np.array([S]), legs, np.array([T]), r, np.array([2.5]), np.array([1.0]), np.array([sigma]), 1e-6, 100)
+
+
+def clear_greeks_cache() -> None:
+    """Drop the memoized black_scholes, implied volatility and calculate_price_probability results"""
+    black_scholes.cache_clear()
+    implied_volatility_newton_raphson.cache_clear()
+    calculate_price_probability.cache_clear()
 
 
-class Greeks(BaseModel):
-    """A data class of option Greeks computation"""
+
+
+@dataclass(slots=True)
+class Greeks:
+    """A data class of option Greeks computation
+    built once per leg, a slotted dataclass keeps construction light
+    """
     underlying_price: float
     strike_price: float
     option_type: str
@@ -230,28 +683,16 @@ class Greeks(BaseModel):
     quantity: int | None = None # only used for stocks
     r: float = R
     year_days: int = YEAR_DAYS
-    
-    @field_validator('option_type')
-    def validate_option_type(cls, value):
-        if value not in ['C', 'P', 'S']:
+
+    def __post_init__(self):
+        if self.option_type not in ('C', 'P', 'S'):
             raise ValueError('option_type must be "C" or "P" or "S"')
-        return value
-    @field_validator('strike_price')
-    def validate_strike_price(cls, value):
-        if value <= 0:
+        if self.strike_price <= 0:
             raise ValueError('strike_price must > 0')
-        return value
-    @field_validator('underlying_price')
-    def validate_underlying_price(cls, value):
-        if value <= 0:
+        if self.underlying_price <= 0:
             raise ValueError('underlying_price must > 0')
-        return value
-
-    @model_validator(mode="after")
-    def validate_mark_or_volatility(self):
         if self.volatility is None and self.mark is None:
             raise ValueError("Either 'mark' or 'volatility' must be provided.")
-        return self
 
 
     def calc_greeks(self) -> object:
@@ -299,18 +740,19 @@ class Greeks(BaseModel):
         return self
 
     def __repr__(self) -> str:
-        """Returns a string representation of object."""
-        retstr:str =  (
+        """Returns a string representation of object, greeks that are unset ( None ) are left out."""
+        optional = (
+            ("volatility", self.volatility, ".3f"),
+            ("mark", self.mark, ".2f"),
+            ("delta", self.delta, ".3f"),
+            ("theta", self.theta, ".3f"),
+            ("vega", self.vega, ".3f"),
+        )
+        return (
             f"{self.__class__.__name__}("
             f"underlying_price='{self.underlying_price:.2f}', "
             f"option_type='{self.option_type}', "
-            f"strike_price={self.strike_price:.2f}, "
+            f"strike_price={self.strike_price:.2f}"
+            + "".join(f", {name}={value:{spec}}" for name, value, spec in optional if value is not None)
+            + ")"
         )
-        retstr += f"volatility={self.volatility:.3f}, " if self.volatility else "volatility=None, "
-        retstr += f"mark={self.mark:.2f}, " if self.mark else "mark=None, "
-        retstr += f"delta={self.delta:.3f}, " if self.delta else "delta=None, "
-        retstr += f"theta={self.theta:.3f}, " if self.theta else "theta=None, "
-        retstr += f"vega={self.vega:.3f})" if self.vega else "vega=None)"
-        return retstr
-
-
@@ -7,8 +7,6 @@
 #
 
 import numpy as np
-from scipy.stats import norm
-import matplotlib.pyplot as plt
 
 from pydantic import BaseModel, field_validator, ValidationError # type: ignore
 from .greeks import Greeks
@@ -67,6 +65,12 @@ class OptionLeg(BaseModel, arbitrary_types_allowed=True):
     symbol: str = None
     expiration_date: str | date | None = None
 
+    @field_validator('option_type')
+    def validate_option_type(cls, value):
+        if value not in ('C', 'P', 'S'):
+            raise ValueError('option_type must be "C" or "P" or "S"')
+        return value
+
     @field_validator('quantity')
     def validate_quantity(cls, value):
         if value == 0:
@@ -134,20 +138,67 @@ class OptionLeg(BaseModel, arbitrary_types_allowed=True):
         """Model of key OptionLeg Stat Components"""
         return OptionLegRepr(**(dict(self)))
 
+
     def calc_payoff(self, underlying_price: float) -> float:
         """Calculates the payoff of the option leg at a given underlying price.
 
         Args:
-             underlying_price (float): The price of the underlying asset at expiration.
+             underlying_price (float | np.ndarray): The price of the underlying asset at expiration.
 
         Returns:
-            float:  The payoff of the leg.
+            float | np.ndarray:  The payoff of the leg, per price when given an array.
         """
         if self.option_type == 'C':
-            return (max(0, underlying_price - self.strike_price) * self.quantity) - (self.mark * self.quantity)
+            return (np.maximum(0, underlying_price - self.strike_price) * self.quantity) - (self.mark * self.quantity)
         elif self.option_type == 'P':
-            return (max(0, self.strike_price - underlying_price) * self.quantity) - (self.mark * self.quantity)
+            return (np.maximum(0, self.strike_price - underlying_price) * self.quantity) - (self.mark * self.quantity)
         elif self.option_type == 'S':
             # stock is of 100 units 
             return (underlying_price -  self.strike_price) * self.quantity/100
 
+
+class OptionLegArrays(BaseModel, arbitrary_types_allowed=True):
+    """Column ( structure of arrays ) view of a list of OptionLegs,
+    one entry per leg, for pricing all legs in a single broadcast
+    """
+    strikes: np.ndarray
+    vols: np.ndarray
+    dtes: np.ndarray
+    marks: np.ndarray
+    quantities: np.ndarray
+    units: np.ndarray      # quantity in contracts, stock legs in lots of 100
+    is_call: np.ndarray
+    is_stock: np.ndarray
+    phi: np.ndarray        # 1 call, -1 put, 0 stock
+    deltas: np.ndarray
+    thetas: np.ndarray
+    vegas: np.ndarray
+    gammas: np.ndarray
+
+    @classmethod
+    def from_legs(cls, legs: list[OptionLeg]) -> 'OptionLegArrays':
+        """Build the arrays from OptionLeg rows"""
+        is_stock = np.array([leg.option_type == 'S' for leg in legs], dtype=bool)
+        is_call = np.array([leg.option_type == 'C' for leg in legs], dtype=bool)
+        quantities = np.array([leg.quantity for leg in legs], dtype=float)
+        return cls(
+            strikes=np.array([leg.strike_price for leg in legs], dtype=float),
+            # stock legs may carry no volatility, they are never priced by black scholes
+            vols=np.array([leg.volatility or 0.0 for leg in legs], dtype=float),
+            dtes=np.array([leg.days_to_expiration for leg in legs], dtype=float),
+            marks=np.array([leg.mark for leg in legs], dtype=float),
+            quantities=quantities,
+            units=np.where(is_stock, quantities / 100, quantities),
+            is_call=is_call,
+            is_stock=is_stock,
+            phi=np.where(is_stock, 0.0, np.where(is_call, 1.0, -1.0)),
+            # unset greeks come through as nan
+            deltas=np.array([leg.delta for leg in legs], dtype=float),
+            thetas=np.array([leg.theta for leg in legs], dtype=float),
+            vegas=np.array([leg.vega for leg in legs], dtype=float),
+            gammas=np.array([leg.gamma for leg in legs], dtype=float),
+        )
+
+    @property
+    def is_short(self) -> np.ndarray:
+        return self.quantities < 0
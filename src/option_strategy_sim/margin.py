@@ -11,6 +11,7 @@ https://github.com/tastyware/margin-estimator/tree/main
 
 
 from __future__ import annotations
+from enum import IntEnum
 import numpy as np
 # import OptionStrategy
 from typing import List
@@ -55,9 +56,47 @@ ETFS = {
     'SDD': 2, 'UBR': 2, 'RXD': 2, 'SDP': 2, 'MZZ': 2, 'SCC': 2, 'SIJ': 2, 'SMN': 2, 'SZK': 2, 
     'SQQQ': 3, 'UDOW': 3, 'URTY': 3, 'SPXU': 3, 'SDOW': 3, 'SRTY': 3, 'UMDD': 3, 'TTT': 3, 'SMDD': 3
 }
+# membership test on the symbols, leverage kept only where it is not 1x
+BROAD_ETFS = frozenset(ETFS)
+LEVERAGED_ETFS = {symbol: leverage for symbol, leverage in ETFS.items() if leverage != 1}
 
 STOCK_MARGIN = 0.25 # brokers range from 0.2 - 0.5
 
+
+class LegShape(IntEnum):
+    """How a set of option legs is margined"""
+    SUM = 0  # no recognized shape, the sum of each leg margin
+    LONG = 1
+    SHORT = 2
+    SHORT_STRANGLE = 3
+    SPREAD = 4
+    IRON_CONDOR = 5
+
+
+def classify_legs(legs: list[option_strategy_sim.leg.OptionLeg]) -> LegShape:
+    """Classify option legs for margin, the shape only changes with the legs"""
+    if len(legs) == 1:
+        return LegShape.LONG if legs[0].quantity > 0 else LegShape.SHORT
+    if len(legs) == 2:
+        if legs[0].quantity < 0 and legs[1].quantity < 0:
+            return LegShape.SHORT_STRANGLE
+        # a spread
+        if legs[0].option_type == legs[1].option_type and legs[0].quantity == -legs[1].quantity:
+            return LegShape.SPREAD
+    if len(legs) == 4:
+        # iron condor
+        calls = [leg for leg in legs if leg.option_type == 'C']
+        puts = [leg for leg in legs if leg.option_type == 'P']
+        if len(calls) == len(puts) and len(puts) == 2:
+            if calls[0].quantity + calls[1].quantity == 0:
+                if puts[0].quantity + puts[1].quantity == 0:
+                    if abs(puts[0].quantity) == abs(calls[0].quantity):
+                        return LegShape.IRON_CONDOR
+    # from here we will simply sum the legs
+    # can we do more ? if 3 legs, see if there is a spread ?
+    # if not, this sum will over-estimate some cases
+    return LegShape.SUM
+
     
 class MarginCalculator:
     """Calculates margin requirements for an option strategy."""
@@ -65,6 +104,15 @@ class MarginCalculator:
     def __init__(self, ostrat: option_strategy_sim.core.OptionStrategy):
         """Initializes with the option strategy."""
         self.ostrat: option_strategy_sim.core.OptionStrategy = ostrat
+        # margin rule for each leg shape, every entry takes the list of legs
+        self._shape_margin = {
+            LegShape.SUM: lambda legs: self._calc_option_margin_assum(*legs),
+            LegShape.LONG: lambda legs: self._calc_margin_long_option(legs[0]),
+            LegShape.SHORT: lambda legs: self._calc_margin_short_option(legs[0]),
+            LegShape.SHORT_STRANGLE: self._calc_margin_short_strangle,
+            LegShape.SPREAD: self._calc_margin_spread,
+            LegShape.IRON_CONDOR: self._calc_margin_ironcondor_legs,
+        }
 
 
     def calculate_margin(self) -> tuple[float,float]:
@@ -91,46 +139,31 @@ class MarginCalculator:
 
 
     def _calc_option_margin(self, *legs) -> tuple[float,float]:
-        if len(legs) == 0: 
+        if len(legs) == 0:
+            # the strategy keeps the shape of its legs until they change
             legs = self.ostrat.option_legs()
-        if len(legs) == 1:
-            if legs[0].quantity > 0:
-                return self._calc_margin_long_option(legs[0])
-            return self._calc_margin_short_option(legs[0])
-        if len(legs) == 2:
-            if legs[0].quantity < 0 and legs[1].quantity < 0:
-                return self._calc_margin_short_strangle(legs)
-            else: # a spread
-                if legs[0].option_type == legs[1].option_type:
-                    if legs[0].quantity == -legs[1].quantity:
-                        return self._calc_margin_spread(legs)
+            shape = self.ostrat.option_shape()
+        else:
+            shape = classify_legs(legs)
+        return self._shape_margin[shape](legs)
 
-        if len(legs) == 4:
-            # iron condor 
-            calls = [leg for leg in legs if leg.option_type == 'C']
-            puts = [leg for leg in legs if leg.option_type == 'P']
-            if len(calls) == len(puts) and len(puts) == 2:
-                if calls[0].quantity + calls[1].quantity == 0:
-                    if puts[0].quantity + puts[1].quantity == 0:
-                        if abs(puts[0].quantity) == abs(calls[0].quantity):
-                            return self._calc_margin_ironcondor(calls,puts)
-        # from here we will simply sum the legs 
-        # can we do more ? if 3 legs, see if there is a spread ? 
-        # if not, this sum will over-estimate some cases
-        return self._calc_option_margin_assum(*legs)
-    
 
     def _calc_stock_margin(self, *legs) -> tuple[float,float]:
         """Calculates margin for stock legs, typically 50% of value or some other percentage"""
-        if len(legs) == 0: 
-            legs = self.ostrat.stock_legs()
-        margin: float = 0.0
-        cash: float = 0.0
-        for leg in legs:
-            margin += abs(leg.mark * leg.quantity) * STOCK_MARGIN
-            cash += abs(leg.mark * leg.quantity)        
-        return cash, margin
+        if len(legs) == 0:
+            # strategy stock legs from the cached leg columns
+            arrays = self.ostrat.leg_arrays()
+            notional = float(np.abs(arrays.marks * arrays.quantities)[arrays.is_stock].sum())
+        else:
+            notional = sum(abs(leg.mark * leg.quantity) for leg in legs)
+        # cash covers the notional, margin a share of it
+        return notional, notional * STOCK_MARGIN
     
+    def _calc_margin_ironcondor_legs(self, legs) -> tuple[float,float]:
+        calls = [leg for leg in legs if leg.option_type == 'C']
+        puts = [leg for leg in legs if leg.option_type == 'P']
+        return self._calc_margin_ironcondor(calls, puts)
+
     def _calc_margin_ironcondor(self, calls, puts):
         cash1, margin1 = self._calc_margin_spread(calls)
         cash2, margin2 = self._calc_margin_spread(puts)
@@ -168,8 +201,8 @@ class MarginCalculator:
 
         underlying_symbol = self.ostrat.underlying_symbol or '_'
         # broad-based ETFs/indices
-        if underlying_symbol in ETFS: 
-            leverage = ETFS[underlying_symbol] or 1
+        if underlying_symbol in BROAD_ETFS:
+            leverage = LEVERAGED_ETFS.get(underlying_symbol, 1)
             if leg.option_type == 'P':
                 minimum = leg.mark + leg.strike_price / 10 * leverage
                 base = leg.strike_price + stprice * 3 / 20 * leverage - otm_distance
@@ -230,37 +263,20 @@ class MarginCalculator:
             margin = margin2 + legs[0].mark * 100 * abs(legs[0].quantity)
         return cash, margin
 
-    def _calc_loss_for(self,leg: option_strategy_sim.leg.OptionLeg, price: float) -> float:
-        """
-        Calculate value at expiration for option at given price.
-        """
-        if leg.option_type == 'C':
-            itm_distance = max(0, price - leg.strike_price)
-        else:
-            itm_distance = max(0, leg.strike_price - price)
-        return itm_distance * leg.quantity * 100
-
-
-    def _get_net_credit_or_debit(self, legs) -> float:
-        """
-        Calculate total debit/credit paid/collected for the order.
-        """
-        total = 0
-        for leg in legs:
-            total += leg.quantity * leg.mark * 100
-        return total
-
-
     def _calc_margin_spread(self, legs) -> tuple[float,float]:
         """
         Calculate margin for a credit spread.
         Source: CBOE Margin Manual
         """
-        strikes = [leg.strike_price for leg in legs]
-        pnl = self._get_net_credit_or_debit(legs)
-        losses = []
-        for strike in strikes:
-            points = [self._calc_loss_for(leg, strike) for leg in legs]
-            losses.append(sum(points))  # type: ignore
-        require = abs(min(losses)) + pnl
+        strikes = np.array([leg.strike_price for leg in legs], dtype=float)
+        quantities = np.array([leg.quantity for leg in legs], dtype=float)
+        is_call = np.array([leg.option_type == 'C' for leg in legs])
+        marks = np.array([leg.mark for leg in legs], dtype=float)
+        # total debit/credit paid/collected for the order
+        pnl = float((quantities * marks * 100).sum())
+        # value at expiration of every leg ( columns ) with the underlying at each strike ( rows )
+        prices = strikes[:, None]
+        itm_distance = np.where(is_call, np.maximum(0, prices - strikes), np.maximum(0, strikes - prices))
+        losses = (itm_distance * quantities * 100).sum(axis=1)
+        require = abs(float(losses.min())) + pnl
         return require, require
@@ -9,12 +9,22 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib import patheffects as pe
+from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 
 
 
 def _find_pnl_even_points(arr: np.ndarray) -> np.ndarray:
     """Finds the indices where the PnL crosses zero (breakeven points)."""
     # arr is like our pnl_values array
+    arr = np.asarray(arr)
+    if not (arr == 0).any():
+        # no zeros, so a crossing is just the sign bit flipping between neighbours
+        signbits = np.signbit(arr)
+        return np.nonzero(signbits[:-1] != signbits[1:])[0] + 1
+
     signs = np.sign(arr)
     # Remove any zeros as it is not a sign change
     non_zero_indices = np.where(signs != 0)[0]
@@ -27,7 +37,8 @@ def _find_pnl_even_points(arr: np.ndarray) -> np.ndarray:
     change_indices = non_zero_indices[np.where(sign_changes != 0)[0] + 1]  # adjust index to match the original array
     return change_indices
 
-def plot_strategy(ostrat, days_forward: int = None, dte: int = None, partitions: int = None, savefig: str = None, show: bool = True):
+def plot_strategy(ostrat, days_forward: int = None, dte: int = None, partitions: int = None, savefig: str = None, show: bool = True, dpi: int = 150,
+                  fig_state: dict = None) -> dict:
     """Plots the P&L and expected P&L of the strategy
     Args:
         ostrat: An object representing the option strategy to be plotted.  
@@ -40,7 +51,12 @@ def plot_strategy(ostrat, days_forward: int = None, dte: int = None, partitions:
         partitions (int, optional): Number of partitions to calculate the P&L. Used in `ostrat.add_pnl`. Defaults to None.
         savefig (str, optional): The file path to save the plot to. If None, the plot is not saved. Defaults to None.
         show (bool, optional): Whether to display the plot. Defaults to True.  
+        dpi (int, optional): Resolution of the rasterized pnl curves when saving. Defaults to 150.
+        fig_state (dict, optional): The dict returned by an earlier call. The figure in it is
+            updated in place instead of building a new one, for repeated plots in a notebook. Defaults to None.
 
+    Returns:
+        dict: The figure, axes and artists of the plot, to pass back as fig_state.
     """
 
     # set up theo price curves if needed - this is noop if all None
@@ -58,82 +74,123 @@ def plot_strategy(ostrat, days_forward: int = None, dte: int = None, partitions:
     expected_profit = ostrat.expected_profit()
     pop = ostrat.pop()
 
+    # an empty or missing fig_state builds the figure, a filled one is updated in place
+    first_draw = not fig_state
+    if first_draw:
+        fig_state = {} if fig_state is None else fig_state
+        fig_state.update(_new_figure(headless=not show))
+    fig, ax1, ax2 = fig_state["fig"], fig_state["ax1"], fig_state["ax2"]
 
-
-    fig, ax1 = plt.subplots(figsize=(12, 7), facecolor="#f0f0f0")  # Light background
-    ax1.set_facecolor("#ffffff") # white background for main plot
+    # the markers below are a handful of points, redraw them rather than track each one
+    for artist in fig_state["markers"]:
+        artist.remove()
+    markers = fig_state["markers"] = []
 
     # Setup 1-std bar = expected move lines with a softer look
     emmin = underlying_price - stddev
     emmax = underlying_price + stddev
-    ax1.plot([emmin, emmax], [0, 0], color='#a8dadc', linestyle='-', linewidth=8, alpha=0.6, label=f"Expected Move ({emmin:.2f} - {emmax:.2f})") # Reduced thickness & muted color
+    em_line, = ax1.plot([emmin, emmax], [0, 0], color='#a8dadc', linestyle='-', linewidth=8, alpha=0.6, label=f"Expected Move ({emmin:.2f} - {emmax:.2f})") # Reduced thickness & muted color
+    markers.append(em_line)
 
     # Setup 2-std lines with a dash-dot pattern
     stdmin = underlying_price - 2 * stddev
     stdmax = underlying_price + 2 * stddev
-    for std in [stdmin, stdmax]:
-        ax1.axvline(std, color='#457b9d', linestyle='-.', alpha=0.7, label=f'2-std {std:.2f}')  # Darker, less obtrusive lines
+    std_lines = [ax1.axvline(std, color='#457b9d', linestyle='-.', alpha=0.7, label=f'2-std {std:.2f}') for std in [stdmin, stdmax]]  # Darker, less obtrusive lines
+    markers.extend(std_lines)
 
-    ax1.axvspan(underlying_price-2*stddev, underlying_price-stddev, color='0.95')
-    ax1.axvspan(underlying_price-stddev, underlying_price+stddev, color='0.9')
-    ax1.axvspan(underlying_price+stddev, underlying_price+2*stddev, color='0.95')
-    ax1.axvline(underlying_price, color='darkgrey', linestyle='--')
+    markers.append(ax1.axvspan(underlying_price-2*stddev, underlying_price-stddev, color='0.95'))
+    markers.append(ax1.axvspan(underlying_price-stddev, underlying_price+stddev, color='0.9'))
+    markers.append(ax1.axvspan(underlying_price+stddev, underlying_price+2*stddev, color='0.95'))
+    markers.append(ax1.axvline(underlying_price, color='darkgrey', linestyle='--'))
 
+    # the pnl curves are kept between calls and only get new data
+    pnl_line = fig_state["pnl_line"]
+    pnl_line.set_data(price_range, pnl_values)
+    pnl_line.set_label(f"PnL Payoff: ExP({expected_profit:.2f}) POP({pop:.2f})")
 
-    # Plot PnL with a vibrant blue and a slight shadow effect for depth
-    ax1.plot(price_range, pnl_values, color='#2a6f97', linewidth=2.5, label=f"PnL Payoff: ExP({expected_profit:.2f}) POP({pop:.2f})", zorder=3)  # Darker shade of blue
-    ax1.plot(price_range, pnl_values, color="#000000", linewidth=4, alpha=0.04, zorder=1)  # slight shadow to make the line "pop"
     # set up theo price curves
-
-    if len(ostrat.pnls) > 1:
-        colors = plt.cm.viridis(np.linspace(0.2, 0.9, len(ostrat.pnls[1:])))
-        for idx, opnl in enumerate(ostrat.pnls[1:]):
-            ax1.plot(
-                price_range,
-                opnl.calc_pnl_values(at_expire=True),
-                label=f'PnL at {opnl.days_to_expiration} dte ExP({opnl.expected_profit:.2f}) POP({opnl.pop:.2f})',
-                color=colors[idx],  # use a color map
-                linewidth=1.3, linestyle='--', alpha=0.8, zorder=2)  # slightly softer lines
-
-    ax1.set_xlabel('Underlying Price at Expiration', color='#343a40', fontsize=11)  # Darker font color
-    ax1.set_ylabel('Profit / Loss', color='#2a6f97', fontsize=11)  # Corresponding color
-    ax1.tick_params(axis='y', labelcolor='#2a6f97') # label ticks
-
-
-    # Secondary y-axis for Expected P&L with a distinct color
-    ax2 = ax1.twinx()
-    ax2.plot(price_range, expected_pnl_values, color='#964f8e', linewidth=2, linestyle='-', label=f"Expected PnL", alpha=0.8)  # Lighter purple, solid line
-    ax2.set_ylabel('Expected Profit / Loss', color='#964f8e', fontsize=11)
-    ax2.tick_params(axis='y', labelcolor='#964f8e')
+    # all drawn as one LineCollection, with proxy lines carrying the legend labels
+    theo_handles = []
+    colors = plt.cm.viridis(np.linspace(0.2, 0.9, len(ostrat.pnls[1:])))
+    fig_state["theo"].set_segments([np.column_stack([price_range, opnl.expiry_pnl_values()]) for opnl in ostrat.pnls[1:]])
+    fig_state["theo"].set_color(colors)  # use a color map
+    for idx, opnl in enumerate(ostrat.pnls[1:]):
+        theo_handles.append(Line2D(
+            [], [],
+            label=f'PnL at {opnl.days_to_expiration} dte ExP({opnl.expected_profit:.2f}) POP({opnl.pop:.2f})',
+            color=colors[idx], linewidth=1.3, linestyle='--', alpha=0.8))
+
+    expected_line = fig_state["expected_line"]
+    expected_line.set_data(price_range, expected_pnl_values)
 
     # Align y-axes to share the zero point for clarity
     max_y1 = max(abs(pnl_values.min()), abs(pnl_values.max()))
     max_y2 = max(abs(expected_pnl_values.min()), abs(expected_pnl_values.max()))
+    ax1.relim()
+    ax1.autoscale_view(scaley=False)
     ax1.set_ylim(-max_y1 * 1.1, max_y1 * 1.1)  # added padding
     ax2.set_ylim(-max_y2 * 1.1, max_y2 * 1.1)
 
 
     # Add breakeven (BE) points with subtle, dashed lines
+    be_lines = []
     idxs = _find_pnl_even_points(pnl_values)
     for idx in idxs:
         price_point = price_range[idx]
-        ax1.axvline(price_point, color='#e63946', linestyle=':', alpha=0.8, label=f'BE {price_point:.2f}')  # Red, dashed lines for BE
-
-    ax1.axhline(0, color='#495057', linewidth=0.7)  # Zero line - lighter grey
+        be_lines.append(ax1.axvline(price_point, color='#e63946', linestyle=':', alpha=0.8, label=f'BE {price_point:.2f}'))  # Red, dashed lines for BE
+    markers.extend(be_lines)
 
     # Title with a more prominent appearance
-    plt.title(f"{title}: {underlying_symbol} ({ostrat.days_to_expiration} DTE)", fontsize=13, fontweight='bold', color='#343a40')
+    ax2.set_title(f"{title}: {underlying_symbol} ({ostrat.days_to_expiration} DTE)", fontsize=13, fontweight='bold', color='#343a40')
 
 
     # Combine legends and adjust layout for better visibility
-    lines, labels = ax1.get_legend_handles_labels()
-    lines2, labels2 = ax2.get_legend_handles_labels()
-    ax2.legend(lines + lines2, labels + labels2, loc='upper center', bbox_to_anchor=(0.5, -0.15), ncol=3, frameon=False)  #  legend position
-    plt.tight_layout()  # make room for the axis titles
-    ax1.grid(True, linestyle='--', alpha=0.5) # Grid overlay with alpha
+    lines = [em_line, *std_lines, pnl_line, *theo_handles, *be_lines, expected_line]
+    ax2.legend(lines, [line.get_label() for line in lines], loc='upper center', bbox_to_anchor=(0.5, -0.15), ncol=3, frameon=False)  #  legend position
+    if first_draw:
+        fig.tight_layout()  # make room for the axis titles
 
     if savefig is not None:
-        plt.savefig(savefig)
-    if not show:
-        plt.close()
-    plt.show()
+        # the pnl curves are rasterized at dpi, axes and text stay vector
+        fig.savefig(savefig, dpi=dpi)
+    if not first_draw:
+        # the figure is already on screen, let the canvas pick up the changes
+        fig.canvas.draw_idle()
+        return fig_state
+    if show:
+        plt.show()
+    return fig_state
+
+
+def _new_figure(headless: bool = False) -> dict:
+    """Figure, axes styling and empty pnl curve artists for plot_strategy,
+    a headless figure is not registered with pyplot or its gui backend, only saved
+    """
+    if headless:
+        fig = Figure(figsize=(12, 7), facecolor="#f0f0f0")
+        ax1 = fig.subplots()
+    else:
+        fig, ax1 = plt.subplots(figsize=(12, 7), facecolor="#f0f0f0")  # Light background
+    ax1.set_facecolor("#ffffff") # white background for main plot
+
+    # Plot PnL with a vibrant blue and a slight shadow effect for depth
+    # the shadow is a path effect on the same line, so the curve is only drawn as one artist
+    pnl_line, = ax1.plot([], [], color='#2a6f97', linewidth=2.5, zorder=3, rasterized=True,
+             path_effects=[pe.SimpleLineShadow(offset=(0, 0), shadow_color="#000000", alpha=0.04, linewidth=4), pe.Normal()])  # Darker shade of blue, slight shadow to make the line "pop"
+    theo = ax1.add_collection(LineCollection(
+        [], linewidths=1.3, linestyles='--', alpha=0.8, zorder=2, rasterized=True))  # slightly softer lines
+
+    ax1.set_xlabel('Underlying Price at Expiration', color='#343a40', fontsize=11)  # Darker font color
+    ax1.set_ylabel('Profit / Loss', color='#2a6f97', fontsize=11)  # Corresponding color
+    ax1.tick_params(axis='y', labelcolor='#2a6f97') # label ticks
+
+
+    # Secondary y-axis for Expected P&L with a distinct color
+    ax2 = ax1.twinx()
+    expected_line, = ax2.plot([], [], color='#964f8e', linewidth=2, linestyle='-', label=f"Expected PnL", alpha=0.8, rasterized=True)  # Lighter purple, solid line
+    ax2.set_ylabel('Expected Profit / Loss', color='#964f8e', fontsize=11)
+    ax2.tick_params(axis='y', labelcolor='#964f8e')
+
+    ax1.axhline(0, color='#495057', linewidth=0.7)  # Zero line - lighter grey
+    ax1.grid(True, linestyle='--', alpha=0.5) # Grid overlay with alpha
+    return dict(fig=fig, ax1=ax1, ax2=ax2, pnl_line=pnl_line, theo=theo, expected_line=expected_line, markers=[])
@@ -7,13 +7,13 @@
 #
 
 import numpy as np
-from scipy.stats import norm
-import matplotlib.pyplot as plt
+from dataclasses import dataclass, field, fields
+from scipy.special import ndtr
 from pydantic import BaseModel, field_validator, ValidationError # type: ignore
 from typing import List, Any
 
-from .greeks import black_scholes
-from .utils import class_args, model_repr
+from .greeks import black_scholes, _bs_mark_vec, _pnl_grid, YEAR_DAYS
+from .utils import class_args, model_repr, HAS_NUMBA
 
 class OptionPnLRepr(BaseModel, extra='allow'):
     """
@@ -30,7 +30,10 @@ class OptionPnLRepr(BaseModel, extra='allow'):
         super().__init__(**class_args(kwargs, self.model_fields))
 
 
-class OptionPnL(BaseModel, arbitrary_types_allowed=True):
+# a plain slotted dataclass, built once per pnl curve and never validated;
+# OptionPnLRepr is the pydantic view of it
+@dataclass(slots=True, eq=False)
+class OptionPnL:
     optionstrategy: 'OptionStrategy'
     days_to_expiration: float = None
     payoff: bool = False  # True if we are reviewing expiration
@@ -44,6 +47,7 @@ class OptionPnL(BaseModel, arbitrary_types_allowed=True):
     pnl_values: np.ndarray = None         # PnL array for price_range
 
     expected_pnl_values: np.ndarray = None # PnL array weighted by probability
+    _expiry_pnl_values: np.ndarray = field(default=None, init=False, repr=False)  # built by expiry_pnl_values()
     #########################################
     # Parent OptionStrategy data access points
     # optionstrategy.underlying_price
@@ -57,16 +61,19 @@ class OptionPnL(BaseModel, arbitrary_types_allowed=True):
     #########################################
 
 
-    def __init__(self, **data):
-        super().__init__(**data)
+    def __post_init__(self):
         if self.payoff:
             self.days_to_expiration = 0
+        elif self.days_to_expiration is not None:
+            self.days_to_expiration = float(self.days_to_expiration)
         # build PnL profile
         self.stddev = self.calc_stddev()
         self.price_range = self.calc_price_range()
         self.pnl_values = self.calc_pnl_values()
-        self.pop = self.calc_pop()
-        self.expected_pnl_values = self.calc_expected_pnl_values()
+        # price points in standard deviations, shared by the pop and expected pnl weights
+        z = self.calc_price_zscores()
+        self.pop = self.calc_pop(z)
+        self.expected_pnl_values = self.calc_expected_pnl_values(z)
         self.expected_profit = self.calc_expected_profit()
 
 
@@ -77,7 +84,7 @@ class OptionPnL(BaseModel, arbitrary_types_allowed=True):
 
     def repr(self) -> OptionPnLRepr:
         """Model of key OptionPnL Stat Components"""
-        return OptionPnLRepr(**(dict(self)))
+        return OptionPnLRepr(**{f.name: getattr(self, f.name) for f in fields(self)})
 
 
     def calc_time_scale(self, at_expire: bool = False) -> float:
@@ -100,14 +107,17 @@ class OptionPnL(BaseModel, arbitrary_types_allowed=True):
                 np.ndarray: An array of simulated prices within stddev range
         """
         stddev = self.calc_stddev(at_expire) if at_expire else self.stddev
-        # our price range simulation is +/- stddev_range deviations from underlying
-        return np.linspace(
-                self.optionstrategy.underlying_price - self.optionstrategy.stddev_range * stddev,
-                self.optionstrategy.underlying_price + self.optionstrategy.stddev_range * stddev,
-                self.optionstrategy.num_simulations)
+        # our price range simulation is +/- stddev_range deviations from underlying,
+        # one multiply-add on the strategy's shared -1..1 ramp
+        return self.optionstrategy.underlying_price + (self.optionstrategy.stddev_range * stddev) * self.optionstrategy.unit_ramp()
 
 
-    def calc_pop(self) -> float:
+    def calc_price_zscores(self) -> np.ndarray:
+        """price_range as standard deviations from the underlying price"""
+        return (self.price_range - self.optionstrategy.underlying_price) / self.stddev
+
+
+    def calc_pop(self, z: np.ndarray = None) -> float:
         """Calculates the Probability of Profit (POP) for the option strategy.
 
         This function estimates the likelihood of the strategy being profitable
@@ -118,35 +128,38 @@ class OptionPnL(BaseModel, arbitrary_types_allowed=True):
             float: The probability of the strategy being profitable,
             expressed as a value between 0 and 1.
         """
-        # pdf is our probability distribution
-        pdf = norm.pdf(
-            self.price_range,
-            loc=self.optionstrategy.underlying_price,
-            scale=self.stddev)
+        if z is None:
+            z = self.calc_price_zscores()
+        pnl = self.pnl_values
         # Find the probability of profit based on the PnL results being above zero
-        profitable_pnl = self.pnl_values > 0  # sets [T,F,TT, etc
-        # prob of profit is
-        # sum pdf where price points are profitable / all pdf points
-        return np.sum(pdf[profitable_pnl]) / np.sum(pdf)
-
-
-    def calc_expected_pnl_values(self) -> np.ndarray:
+        profitable_pnl = pnl > 0  # sets [T,F,TT, etc
+        # breakevens sit between the points where profitable flips,
+        # placed by linear interpolation of the pnl
+        flips = np.flatnonzero(profitable_pnl[1:] != profitable_pnl[:-1])
+        left, right = pnl[flips], pnl[flips + 1]
+        z_be = z[flips] + (z[flips + 1] - z[flips]) * left / (left - right)
+        # prob of profit is the normal mass of the profitable segments
+        # between breakevens / the mass of the whole price range
+        cdf = ndtr(np.concatenate(([z[0]], z_be, [z[-1]])))
+        segment_profitable = profitable_pnl[np.concatenate(([0], flips + 1))]
+        return np.sum(np.diff(cdf)[segment_profitable]) / (cdf[-1] - cdf[0])
+
+
+    def calc_expected_pnl_values(self, z: np.ndarray = None) -> np.ndarray:
         """Simulates P&L results across a price range.
         Weights PnL of eache price point by probability
         of the price result
         """
+        if z is None:
+            z = self.calc_price_zscores()
         # we use the diff between cdf points for histogramic volume of probability
-        cdf_diff = np.diff(
-            norm.cdf(
-                self.price_range,
-                loc=self.optionstrategy.underlying_price,
-                scale=self.stddev),
-            prepend=0)
-
-        # prepending 0 for diff has goofy result in leftmost, reset to repeat of [1]
+        cdf = ndtr(z)
+        cdf_diff = np.empty_like(cdf)
+        np.subtract(cdf[1:], cdf[:-1], out=cdf_diff[1:])
+        # the leftmost point has no diff, repeat of [1]
         cdf_diff[0] = cdf_diff[1]
-        # multiply PnL points by probability of their results
-        return self.pnl_values * cdf_diff
+        # multiply PnL points by probability of their results, in place over the diff buffer
+        return np.multiply(self.pnl_values, cdf_diff, out=cdf_diff)
 
 
     def calc_expected_profit(self) -> float:
@@ -164,11 +177,15 @@ class OptionPnL(BaseModel, arbitrary_types_allowed=True):
         This uses black scholes
         """
         price_range = self.calc_price_range(at_expire) if at_expire else self.price_range
-        pnl_values = np.zeros(len(price_range))
-        for i, at_price in enumerate(price_range):
-            pnl_values[i] = self.future_strategy_value(at_price)
+        return self.future_strategy_values(price_range)
+
 
-        return pnl_values
+    def expiry_pnl_values(self) -> np.ndarray:
+        """calc_pnl_values(at_expire=True), kept after the first call for repeat plots"""
+        # legs changing replaces the pnls, so this never goes stale
+        if self._expiry_pnl_values is None:
+            self._expiry_pnl_values = self.calc_pnl_values(at_expire=True)
+        return self._expiry_pnl_values
 
 
     def future_strategy_value(self, at_price: float) -> float:
@@ -204,6 +221,35 @@ class OptionPnL(BaseModel, arbitrary_types_allowed=True):
         return future_strategy_value
 
 
+    def future_strategy_values(self, prices: np.ndarray) -> np.ndarray:
+        """Calculate the strategy value at some point in the future for an array of prices.
+           Vectorized form of future_strategy_value over the strategy leg arrays,
+           the parallel _pnl_grid kernel with numba, a numpy broadcast without
+        """
+        legs = self.optionstrategy.leg_arrays()
+        tyear = 0.0 if self.payoff else self.days_to_expiration / YEAR_DAYS
+        # payoff values stock from its strike_price ( see OptionLeg.calc_payoff )
+        basis = np.where(legs.is_stock & self.payoff, legs.strikes, legs.marks)
+        if HAS_NUMBA:
+            return _pnl_grid(
+                np.asarray(prices, dtype=float), np.array([tyear]), legs.strikes,
+                legs.vols, legs.phi, legs.units, basis, self.optionstrategy.r)[0]
+
+        at_prices = np.asarray(prices, dtype=float)[:, None]
+        if tyear <= 0:
+            # intrinsic value at expiration
+            future_prices = np.where(
+                legs.is_call,
+                np.maximum(at_prices - legs.strikes, 0),
+                np.maximum(legs.strikes - at_prices, 0))
+        else:
+            future_prices = _bs_mark_vec(
+                at_prices, legs.strikes, tyear, self.optionstrategy.r, legs.vols, legs.phi)
+        future_prices = np.where(legs.is_stock, at_prices, future_prices)
+        # signed units cover both long value gain and short premium kept
+        return ((future_prices - basis) * legs.units).sum(axis=1)
+
+
     def monte_carlo_future_result(self) -> float:
         """
           Calculates expected profit using monte carlo simulation.
@@ -211,14 +257,11 @@ class OptionPnL(BaseModel, arbitrary_types_allowed=True):
           we return the average result
         """
         # this return has variance without large cycle size
-        random_prices = np.random.normal(
-            loc=self.optionstrategy.underlying_price,
-            scale=self.stddev,
-            size=self.optionstrategy.num_simulations)
-
-        pnl_values = np.array(
-            [self.future_strategy_value(price)
-                for price in random_prices])
+        random_prices = (
+            self.optionstrategy.underlying_price
+            + self.stddev * self.optionstrategy.standard_normals())
+
+        pnl_values = self.future_strategy_values(random_prices)
         # average our results for expected_profit
         return pnl_values.mean()
 
@@ -233,26 +276,32 @@ class OptionPnL(BaseModel, arbitrary_types_allowed=True):
         convergence_tolerance: float = 0.01
         max_monte_carlo_simulations: int = 10000 # avoid infinite loops with high variance
 
-        pnl_values = []
+        # running count, mean and sum of squared deviations ( welford, merged a batch at a time )
+        count: int = 0
+        mean: float = 0.0
+        m2: float = 0.0
 
         while True: # loop until convergence
-            random_prices = np.random.normal(
-                loc=self.optionstrategy.underlying_price,
-                scale=self.stddev,
-                size=num_simulations)
+            # the strategy generator, so a seeded strategy repeats
+            random_prices = self.optionstrategy.underlying_price + self.stddev * self.optionstrategy._rng.standard_normal(num_simulations)
 
-            pnl_values.extend([self.future_strategy_value(price) for price in random_prices])
+            pnl_values = self.future_strategy_values(random_prices)
+            batch_mean = pnl_values.mean()
+            delta = batch_mean - mean
+            total = count + len(pnl_values)
+            mean += delta * len(pnl_values) / total
+            m2 += np.square(pnl_values - batch_mean).sum() + delta**2 * count * len(pnl_values) / total
+            count = total
 
-            if len(pnl_values) > 1:
-                current_mean = np.mean(pnl_values)
-                sem = np.std(pnl_values, ddof=1) / np.sqrt(len(pnl_values))
+            if count > 1:
+                sem = np.sqrt(m2 / (count - 1)) / np.sqrt(count)
 
                 if sem < convergence_tolerance:
-                    return current_mean
+                    return mean
 
-            if len(pnl_values) > max_monte_carlo_simulations:
-                return np.mean(pnl_values)
+            if count > max_monte_carlo_simulations:
+                return mean
             #increment simulation size
-            num_simulations =  min(num_simulations * 2 , max_monte_carlo_simulations - len(pnl_values)) if (
-                num_simulations < max_monte_carlo_simulations - len(pnl_values)
+            num_simulations =  min(num_simulations * 2 , max_monte_carlo_simulations - count) if (
+                num_simulations < max_monte_carlo_simulations - count
                 ) else 1
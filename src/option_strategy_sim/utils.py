@@ -8,9 +8,23 @@
 """"Misc functions in need of a home""" 
 
 import numpy as np
-from scipy.stats import norm
 import json 
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    # numba is optional ( pip install .[jit] ), kernels run as plain python without it
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit which returns the function undecorated"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+    prange = range
+
 def class_args(data:dict, fields: list) -> dict:
     # return slice of dict that matches fieldlist 
     return {key: data.pop(key) for key in fields if key in data}
@@ -38,8 +52,16 @@ def calculate_ema(prices: np.ndarray, window: int) -> np.ndarray:
         ema = calculate_ema(prices, window) # ema will be approx [10, 11, 12.25, 13.18, 14.09]
 
     """
-    ema = np.zeros(len(prices))
-    alpha = 2 / (window + 1)
+    prices = np.asarray(prices, dtype=float)
+    if len(prices) == 0:
+        return np.zeros(0)
+    return _ema(prices, 2 / (window + 1))
+
+
+@njit(cache=True)
+def _ema(prices: np.ndarray, alpha: float) -> np.ndarray:
+    """EMA recurrence, each point depends on the last so it is a compiled loop"""
+    ema = np.empty(len(prices))
     ema[0] = prices[0]
     for t in range(1, len(prices)):
         ema[t] = alpha * prices[t] + (1 - alpha) * ema[t - 1]
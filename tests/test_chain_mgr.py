@@ -0,0 +1,52 @@
+
+# test_chain_mgr.py
+
+import math
+import os
+import unittest
+import pandas as pd
+from option_strategy_sim.chain_mgr import OptionChains
+
+CHAINS_CSV = os.path.join(os.path.dirname(__file__), "..", "dev", "20250114_chains.csv")
+
+
+def chain_summary(chain):
+    # module level so worker processes can unpickle it
+    price = float(chain.underlying_price())
+    chain.chains = chain.chains.iloc[:0]  # a copy, must not reach the cached chain
+    return price
+
+
+class TestOptionChains(unittest.TestCase):
+
+    def setUp(self):
+        # the head of the sample chains holds two symbols, ZM and TSLA
+        self.option_chains = OptionChains(chains=pd.read_csv(CHAINS_CSV, nrows=4000))
+
+    def test_batch_evaluate(self):
+        symbols = list(self.option_chains.underlying_symbols())
+        expected = {symbol: float(self.option_chains.get_symbol_chain(symbol).underlying_price()) for symbol in symbols}
+        rows = {symbol: len(self.option_chains.get_symbol_chain(symbol).chains) for symbol in symbols}
+
+        # in process and in a small pool give the same results
+        self.assertEqual(self.option_chains.batch_evaluate(symbols, chain_summary), expected)
+        self.assertEqual(self.option_chains.batch_evaluate(symbols, chain_summary, n_jobs=2), expected)
+
+        # strategy_fn works on copies on both paths
+        for symbol in symbols:
+            self.assertEqual(len(self.option_chains.get_symbol_chain(symbol).chains), rows[symbol])
+
+    def test_volatility_ratio_missing_vol(self):
+        # a missing volatility counts as zero in the skew, it does not make it nan
+        chains = pd.read_csv(CHAINS_CSV, nrows=4000)
+        row = chains.index[(chains["option_type"] == "P") & chains["delta"].between(-0.3, -0.2)][0]
+        chains.loc[row, "volatility"] = float("nan")
+        dte_chain = OptionChains(chains=chains).get_symbol_chain(chains.at[row, "underlying_symbol"]).get_dte_chain(
+            int(chains.at[row, "days_to_expiration"]), exact=True)
+        ratio = dte_chain.calc_volatility_ratio()
+        self.assertFalse(math.isnan(ratio))
+        self.assertTrue(-1 <= ratio <= 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,9 @@
-import sys
-sys.path.insert(0,"src")
-sys.path.insert(0,"../src")
-
 import pytest
 from option_strategy_sim.core import OptionStrategy, OptionLeg, OptionStrategyRepr
 from option_strategy_sim.pnl import OptionPnL
+from option_strategy_sim.greeks import black_scholes
 import numpy as np
+from scipy.special import ndtr
 import unittest
 class TestOptionStrategy(unittest.TestCase):
 
@@ -69,6 +67,42 @@ class TestOptionStrategy(unittest.TestCase):
         strategy = OptionStrategy(underlying_price=100.0)
         self.assertAlmostEqual(strategy.volatility(), 0.22) # Default value
 
+    def test_leg_averages_after_leg_change(self):
+        # Test the dte and volatility averages follow legs changed in place or replaced
+        strategy = OptionStrategy(underlying_price=100.0, days_to_expiration=30)
+        strategy.add_leg(option_type='C', strike_price=105.0, volatility=0.2, quantity=1)
+        strategy.add_leg(option_type='P', strike_price=95.0, volatility=0.2, quantity=-1)
+        strategy.legs[0].volatility = 0.6
+        strategy.legs[0].days_to_expiration = 90
+        strategy.reset_legs()
+        self.assertAlmostEqual(strategy.calc_current_dte(), 60.0)
+        self.assertAlmostEqual(strategy.volatility(), 0.4)
+
+        # a new list of the same length is counted fresh
+        strategy.legs = [strategy.legs[1], strategy.legs[1]]
+        strategy.reset_legs()
+        self.assertAlmostEqual(strategy.calc_current_dte(), 30.0)
+        self.assertAlmostEqual(strategy.volatility(), 0.2)
+
+    def test_leg_sums_fold_only_new_legs(self):
+        # adding a leg folds just that leg into the running sums, O(1) per leg
+        strategy = OptionStrategy(underlying_price=100.0, days_to_expiration=30)
+        visits = []
+
+        class CountingLegs(list):
+            def __getitem__(self, index):
+                items = super().__getitem__(index)
+                if isinstance(index, slice):
+                    visits.append(len(items))
+                return items
+
+        strategy.legs = CountingLegs()
+        for strike in range(50):
+            strategy.add_leg(option_type='C', strike_price=100.0 + strike, volatility=0.2, quantity=1)
+        self.assertLessEqual(max(visits), 1)
+        self.assertAlmostEqual(strategy.calc_current_dte(), 30.0)
+        self.assertAlmostEqual(strategy.volatility(), 0.2)
+
     def test_option_legs(self):
         # Test retrieving only option legs
         self.strategy.add_leg(option_type='C', strike_price=105.0, quantity=1)
@@ -103,6 +137,78 @@ class TestOptionStrategy(unittest.TestCase):
         self.strategy.add_pnl(dte=15)
         self.assertEqual(len(self.strategy.pnls), 5)
 
+    def test_leg_arrays(self):
+        # Test the leg column arrays follow the legs
+        self.strategy.add_leg(option_type='C', strike_price=105.0, quantity=1, volatility=0.2)
+        self.assertEqual(len(self.strategy.leg_arrays().strikes), 1)
+        self.strategy.add_leg(option_type='S', strike_price=100.0, quantity=-100)
+        legs = self.strategy.leg_arrays()
+        np.testing.assert_array_equal(legs.strikes, [105.0, 100.0])
+        np.testing.assert_array_equal(legs.units, [1, -1])
+        np.testing.assert_array_equal(legs.is_stock, [False, True])
+        np.testing.assert_array_equal(legs.is_short, [False, True])
+
+    def test_calc_all(self):
+        # Test the one call leg pricing matches the per leg black scholes
+        self.strategy.add_leg(option_type='C', strike_price=105.0, quantity=1, volatility=0.2)
+        self.strategy.add_leg(option_type='P', strike_price=95.0, quantity=-2, volatility=0.25)
+        self.strategy.add_leg(option_type='S', strike_price=100.0, quantity=100)
+        marks, deltas, thetas, vegas, gammas = self.strategy.calc_all(102.0)
+        for i, leg in enumerate(self.strategy.legs[:2]):
+            mark, delta = black_scholes(102.0, leg.strike_price, leg.days_to_expiration, leg.option_type, leg.volatility)[:2]
+            self.assertAlmostEqual(marks[i], mark, places=6)
+            self.assertAlmostEqual(deltas[i], delta, places=6)
+        self.assertEqual((marks[2], deltas[2], vegas[2]), (102.0, 1.0, 0.0))
+
+    def test_future_strategy_values(self):
+        # Test the vectorized strategy value matches the per price value
+        self.strategy.add_leg(option_type='C', strike_price=105.0, quantity=1, volatility=0.2)
+        self.strategy.add_leg(option_type='P', strike_price=95.0, quantity=-2, volatility=0.25)
+        self.strategy.add_leg(option_type='S', strike_price=100.0, quantity=100, mark=100.0)
+        self.strategy.add_pnl(dte=15)
+        prices = np.linspace(80, 120, 9)
+        for pnl in self.strategy.pnls:
+            expected = [pnl.future_strategy_value(price) for price in prices]
+            # the grid kernel prices with the polynomial normal cdf
+            np.testing.assert_allclose(pnl.future_strategy_values(prices), expected, atol=1e-5)
+
+    def test_expiry_pnl_values(self):
+        # Test the expiry pnl curve is computed once and kept
+        self.strategy.add_leg(option_type='C', strike_price=105.0, quantity=1, volatility=0.2)
+        self.strategy.add_pnl(dte=15)
+        pnl = self.strategy.pnls[1]
+        values = pnl.expiry_pnl_values()
+        self.assertIs(pnl.expiry_pnl_values(), values)
+        np.testing.assert_array_equal(values, pnl.calc_pnl_values(at_expire=True))
+
+    def test_pop_from_breakeven(self):
+        # Test pop is the normal mass above the short put breakeven
+        self.strategy.add_leg(option_type='P', strike_price=95.0, quantity=-1, mark=1.5)
+        self.strategy.add_pnl()
+        pnl = self.strategy.pnls[0]
+        z = pnl.calc_price_zscores()
+        z_be = (95.0 - 1.5 - self.strategy.underlying_price) / pnl.stddev
+        expected = (ndtr(z[-1]) - ndtr(z_be)) / (ndtr(z[-1]) - ndtr(z[0]))
+        self.assertAlmostEqual(pnl.pop, expected, places=9)
+
+    def test_monte_carlo_seed(self):
+        # Test a seeded monte carlo expected profit is repeatable
+        profits = []
+        for _ in range(2):
+            strategy = OptionStrategy(underlying_price=100.0, days_to_expiration=30.0, monte_carlo=True, seed=7)
+            strategy.add_leg(option_type='C', strike_price=105.0, quantity=1, volatility=0.2)
+            strategy.add_pnl(dte=15)
+            profits.append([pnl.expected_profit for pnl in strategy.pnls])
+            profits[-1].append(strategy.pnls[1].monte_carlo_future_result_ai())
+        self.assertEqual(profits[0], profits[1])
+
+    def test_antithetic_normals(self):
+        # Test the antithetic draws come in mirrored pairs
+        strategy = OptionStrategy(underlying_price=100.0, num_simulations=1001, seed=7)
+        z = strategy.standard_normals()
+        self.assertEqual(len(z), 1001)
+        np.testing.assert_array_equal(z[501:], -z[:500])
+
     def test_get_pnl_attr(self):
         # Create OptionStrategy and OptionPnL instances
         strategy = OptionStrategy(underlying_price=100, days_to_expiration=30, volatility=0.2)
@@ -1,20 +1,22 @@
 
-# test_greeks.py
-import sys 
-sys.path.insert(0,"src")
-sys.path.insert(0,"../src")
-
 # test_greeks.py
 
 import unittest
 import pytest
 from option_strategy_sim.greeks import (
     black_scholes,
+    black_scholes_vec,
     calculate_price_probability,
+    calculate_price_probability_vec,
     black_scholes_vega,
     implied_volatility_newton_raphson,
+    implied_volatility_newton_raphson_vec,
+    clear_greeks_cache,
+    _pnl_grid,
+    _ncdf_poly,
     Greeks,
 )
+import numpy as np
 from pydantic import ValidationError
 
 
@@ -37,6 +39,27 @@ class TestBlackScholes(unittest.TestCase):
         price, delta, theta, vega, gamma = black_scholes(100, 110, 0, "P", 0.2)
         self.assertEqual(price, 10); self.assertEqual(delta, 0); self.assertIsNone(theta)
     
+    def test_last_day_theta(self):
+        # the option loses what is left of its time value over the last day
+        for option_type in ("C", "P"):
+            price, delta, theta, vega, gamma = black_scholes(100, 100, 1, option_type, 0.25)
+            self.assertLess(theta, 0)
+
+    def test_closed_form_theta(self):
+        # theta follows the one day mark change, per year of time left
+        for days in (30, 90, 365):
+            for strike in (90, 100, 110):
+                price, delta, theta, vega, gamma = black_scholes(100, strike, days, "C", 0.25, r=0)
+                next_price = black_scholes(100, strike, days - 1, "C", 0.25, r=0)[0]
+                self.assertAlmostEqual(theta, (next_price - price) / (days / 365), delta=0.01 * abs(theta) + 1e-4)
+
+    def test_zero_volatility(self):
+        price, delta, theta, vega, gamma = black_scholes(100, 100, 30, "C", 0.0)
+        self.assertAlmostEqual(price, 100 - 100 * np.exp(-0.05 * 30 / 365))
+        self.assertEqual(delta, 1); self.assertEqual(vega, 0); self.assertEqual(gamma, 0)
+        price, delta, theta, vega, gamma = black_scholes(100, 100, 30, "P", 0.0)
+        self.assertEqual(price, 0); self.assertEqual(delta, 0)
+
     def test_invalid_option_type(self):
         with self.assertRaises(ValueError): black_scholes(100, 100, 30, "X", 0.2)
     
@@ -47,6 +70,26 @@ class TestBlackScholes(unittest.TestCase):
         with self.assertRaises(ValueError): black_scholes(100, 100, 30, None, 0.2)
         with self.assertRaises(ValueError): black_scholes(100, 100, 30, "C", None)
 
+    def test_cache(self):
+        clear_greeks_cache()
+        first = black_scholes(100, 95, 30, "P", 0.25)
+        self.assertEqual(black_scholes(100, 95, 30, "P", 0.25), first)
+        self.assertEqual(black_scholes.cache_info().hits, 1)
+        clear_greeks_cache()
+        self.assertEqual(black_scholes.cache_info().currsize, 0)
+        first = implied_volatility_newton_raphson(100, 100, 30, 5, "C")
+        self.assertEqual(implied_volatility_newton_raphson(100, 100, 30, 5, "C"), first)
+        self.assertEqual(implied_volatility_newton_raphson.cache_info().hits, 1)
+        clear_greeks_cache()
+        self.assertEqual(implied_volatility_newton_raphson.cache_info().currsize, 0)
+
+    def test_vectorized_black_scholes(self):
+        strikes = np.array([80, 95, 100, 105, 120])
+        for is_call, option_type in ((True, "C"), (False, "P")):
+            greeks = black_scholes_vec(100, strikes, 30, is_call, 0.25)
+            expected = np.array([black_scholes(100, k, 30, option_type, 0.25) for k in strikes]).T
+            np.testing.assert_allclose(greeks, expected, atol=1e-9)
+
 
 class TestPriceProbability(unittest.TestCase):
     """Test cases for the price probability function."""
@@ -60,6 +103,12 @@ class TestPriceProbability(unittest.TestCase):
         probability = calculate_price_probability(100, 90, 30, 0.2)
         self.assertGreaterEqual(probability, 0); self.assertLessEqual(probability, 1)
 
+    def test_vectorized_probability(self):
+        strikes = np.array([80, 95, 100, 105, 120])
+        probabilities = calculate_price_probability_vec(100, strikes, 30, 0.2)
+        expected = [calculate_price_probability(100, k, 30, 0.2) for k in strikes]
+        np.testing.assert_allclose(probabilities, expected, atol=1e-12)
+
 
 class TestBlackScholesVega(unittest.TestCase):
     """Test cases for the Black-Scholes vega function."""
@@ -82,6 +131,72 @@ class TestImpliedVolatility(unittest.TestCase):
         iv_result = implied_volatility_newton_raphson(100, 100, 30, 1000, "C")
         self.assertIsNone(iv_result)
 
+    def test_non_finite_iv_inputs(self):
+        # a missing mark or time has no volatility, on both solver paths
+        nan = float("nan")
+        self.assertIsNone(implied_volatility_newton_raphson(100, 100, 30, nan, "C"))
+        self.assertIsNone(implied_volatility_newton_raphson(100, 100, nan, 3, "C"))
+        self.assertIsNone(implied_volatility_newton_raphson(100, 100, 30, float("inf"), "P"))
+        iv = implied_volatility_newton_raphson_vec(100.0, np.array([100.0, 100.0]), 30, np.array([nan, 3.0]), True)
+        self.assertTrue(np.isnan(iv[0]))
+        self.assertAlmostEqual(iv[1], implied_volatility_newton_raphson(100, 100, 30, 3.0, "C")[0], places=6)
+
+    def test_iv_vec_nan_row(self):
+        # one contract with a missing time leaves the rest of the batch alone
+        strikes = np.array([90.0, 95.0, 100.0, 105.0, 110.0])
+        days = np.array([30, np.nan, 30, 30, 30])
+        iv = implied_volatility_newton_raphson_vec(100.0, strikes, days, np.array([3.0] * 5), True)
+        self.assertTrue(np.isnan(iv[1]))
+        for i in (0, 2, 3, 4):
+            expected = implied_volatility_newton_raphson(100.0, strikes[i], 30, 3.0, "C")
+            if expected is None:
+                self.assertTrue(np.isnan(iv[i]))
+            else:
+                self.assertAlmostEqual(iv[i], expected[0], places=6)
+
+    def test_far_otm_iv(self):
+        # a fixed 0.2 start diverges on the wings, the inflection point guess does not
+        for strike, option_type in ((150, "C"), (60, "P")):
+            mark = black_scholes(100, strike, 30, option_type, 0.8)[0]
+            iv, delta, theta, vega, gamma = implied_volatility_newton_raphson(100, strike, 30, mark, option_type)
+            self.assertAlmostEqual(iv, 0.8, places=4)
+
+    def test_vectorized_iv(self):
+        strikes = np.array([90, 95, 100, 105, 110, 100])
+        is_call = np.array([False, False, True, True, True, True])
+        marks = np.array([black_scholes(100, k, 30, "C" if c else "P", 0.3)[0] for k, c in zip(strikes, is_call)])
+        marks[-1] = 1000  # unreachable
+        ivs = implied_volatility_newton_raphson_vec(100, strikes, 30, marks, is_call)
+        np.testing.assert_allclose(ivs[:-1], 0.3, atol=1e-5)
+        self.assertTrue(np.isnan(ivs[-1]))
+        for k, c, m, iv in zip(strikes[:-1], is_call, marks, ivs):
+            scalar = implied_volatility_newton_raphson(100, k, 30, m, "C" if c else "P")
+            self.assertAlmostEqual(scalar[0], iv, places=6)
+
+
+class TestPnLGrid(unittest.TestCase):
+    """Test cases for the pnl grid kernel."""
+    def test_ncdf_poly(self):
+        from scipy.special import ndtr
+        for x in np.linspace(-8, 8, 1601):
+            self.assertAlmostEqual(_ncdf_poly(x), ndtr(x), delta=1e-7)
+
+    def test_atm_near_expiry(self):
+        from scipy.stats import norm
+        S = np.linspace(98, 102, 9)
+        T = np.array([0.5 / 365, 2 / 365, 0.0])
+        K, vol, r = 100.0, 0.3, 0.05
+        # long call, short put, both bought/sold at 1.0
+        grid = _pnl_grid(S, T, np.array([K, K]), np.array([vol, vol]), np.array([1.0, -1.0]),
+                         np.array([1.0, -1.0]), np.array([1.0, 1.0]), r)
+        for t, tyear in enumerate(T[:-1]):
+            d1 = (np.log(S / K) + (r + 0.5 * vol**2) * tyear) / (vol * np.sqrt(tyear))
+            d2 = d1 - vol * np.sqrt(tyear)
+            call = S * norm.cdf(d1) - K * np.exp(-r * tyear) * norm.cdf(d2)
+            put = K * np.exp(-r * tyear) * norm.cdf(-d2) - S * norm.cdf(-d1)
+            np.testing.assert_allclose(grid[t], (call - 1) - (put - 1), atol=1e-9)
+        np.testing.assert_allclose(grid[-1], np.maximum(S - K, 0) - np.maximum(K - S, 0), atol=1e-12)
+
 
 class TestGreeksClass(unittest.TestCase):
     """Test cases for the Greeks class."""
@@ -115,14 +230,21 @@ class TestGreeksClass(unittest.TestCase):
     def test_greeks_repr(self):
         greeks = Greeks(underlying_price=100, strike_price=100, days_to_expiration=30, option_type="C",
                          volatility=0.2)
-        actual_repr = repr(greeks)
-        print(actual_repr)
-        actual_repr = repr(greeks).replace(", mark=None", "")
-        actual_repr = actual_repr.replace(", delta=None","").replace(", theta=None", "").replace("vega=None", "")
-        actual_repr = actual_repr.replace(", )",")")
+        # unset greeks are left out of the repr
         self.assertEqual(
-            actual_repr, 
+            repr(greeks),
             "Greeks(underlying_price='100.00', option_type='C', strike_price=100.00, volatility=0.200)")
+        greeks.calc_greeks()
+        self.assertTrue(repr(greeks).startswith(
+            "Greeks(underlying_price='100.00', option_type='C', strike_price=100.00, volatility=0.200, mark="))
+
+        # a zero greek is still shown
+        greeks = Greeks(underlying_price=100, strike_price=100, days_to_expiration=30, option_type="C",
+                         volatility=0.2, delta=0.0, theta=0.0)
+        self.assertEqual(
+            repr(greeks),
+            "Greeks(underlying_price='100.00', option_type='C', strike_price=100.00, volatility=0.200, "
+            "delta=0.000, theta=0.000)")
 
 
 if __name__ == "__main__":
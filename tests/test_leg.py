@@ -1,10 +1,6 @@
 
 # test_leg.py
 
-import sys
-sys.path.insert(0,"src")
-sys.path.insert(0,"../src")
-
 import unittest
 from option_strategy_sim.leg import OptionLeg
 from option_strategy_sim.core import OptionStrategy